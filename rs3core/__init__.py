@@ -0,0 +1,73 @@
+"""Shared engine for the RS3 auto-clicker routines.
+
+Every routine script defines its steps and settings and hands them to
+``Routine``; movement, input, calibration, waits and hotkeys live here so
+they are implemented (and tuned) once.
+
+Names are imported from their submodule on first access, so a script
+only pays for what it uses (``from rs3core import Routine`` does not load
+NumPy or any input library).
+"""
+
+import importlib
+
+_EXPORTS = {
+    'AllOf': '.sensing',
+    'AnyOf': '.sensing',
+    'CachedCapture': '.capture',
+    'CalibrationDB': '.calibration_db',
+    'ColorFraction': '.sensing',
+    'ColoredFormatter': '.log',
+    'Condition': '.sensing',
+    'FrameRing': '.pipeline',
+    'HashChanged': '.sensing',
+    'Histogram': '.metrics',
+    'HotkeyService': '.hotkeys',
+    'InputBackend': '.backends',
+    'InventoryGrid': '.inventory',
+    'InventoryProcessed': '.inventory',
+    'Journal': '.journal',
+    'MetricsRegistry': '.metrics',
+    'MOVEMENT_DEFAULTS': '.motion',
+    'Mover': '.motion',
+    'NullBackend': '.backends',
+    'NullCapture': '.capture',
+    'PixelColor': '.sensing',
+    'PlaybackTimer': '.timing',
+    'RecordingBackend': '.backends',
+    'RegionChanged': '.sensing',
+    'RegionSettled': '.sensing',
+    'RegionStore': '.regions',
+    'Routine': '.engine',
+    'SYSTEM_CLOCK': '.clock',
+    'SamplingProfiler': '.profiler',
+    'ScreenCapture': '.capture',
+    'SensingPipeline': '.pipeline',
+    'SimulatedClock': '.clock',
+    'SystemClock': '.clock',
+    'TemplateLocator': '.locate',
+    'TrajectoryBuilder': '.trajectory',
+    'auto_locate': '.locate',
+    'format_time': '.engine',
+    'get_backend': '.backends',
+    'get_capture': '.capture',
+    'high_resolution_timer': '.timing',
+    'random_target_within': '.motion',
+    'read_journal': '.journal',
+    'scripted_keys': '.hotkeys',
+    'setup_logging': '.log',
+    'stat_key': '.engine',
+    'wait_until': '.timing',
+}
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
+__all__ = sorted(_EXPORTS)
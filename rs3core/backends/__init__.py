@@ -0,0 +1,46 @@
+"""Input backends: where clicks, cursor moves and key presses actually go.
+
+``get_backend`` imports backends lazily, so a machine only needs the
+library for the backend it uses (plain ctypes on Windows, pynput on
+macOS, nothing at all for the headless ``null``/``recording`` ones).
+Setting ``RS3CORE_BACKEND`` overrides whatever a script asks for, e.g.
+``RS3CORE_BACKEND=recording`` to run any routine headless.
+"""
+
+import importlib
+import os
+import sys
+
+from .base import InputBackend
+from .recording import NullBackend, RecordingBackend
+
+BACKENDS = {
+    'win32': ('.win32', 'Win32Backend'),
+    'pynput': ('.pynput', 'PynputBackend'),
+    'pyautogui': ('.pyautogui', 'PyAutoGUIBackend'),
+    'null': ('.recording', 'NullBackend'),
+    'recording': ('.recording', 'RecordingBackend'),
+}
+
+def default_backend_name():
+    return 'win32' if sys.platform == 'win32' else 'pynput'
+
+def get_backend(backend=None, **kwargs):
+    """Resolve a backend name (or None for the platform default) to an instance; instances pass through"""
+    if isinstance(backend, InputBackend):
+        return backend
+    name = os.environ.get('RS3CORE_BACKEND') or backend or default_backend_name()
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown input backend '{name}' (choose from {', '.join(BACKENDS)})")
+    module_name, class_name = BACKENDS[name]
+    module = importlib.import_module(module_name, __name__)
+    return getattr(module, class_name)(**kwargs)
+
+__all__ = [
+    'BACKENDS',
+    'InputBackend',
+    'NullBackend',
+    'RecordingBackend',
+    'default_backend_name',
+    'get_backend',
+]
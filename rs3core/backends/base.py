@@ -0,0 +1,61 @@
+import time
+
+class InputBackend:
+    """Everything the engine needs from the OS: cursor, clicks, keys and hotkey polling.
+
+    Coordinates are screen pixels. ``poll_key`` is non-blocking and returns a
+    single lower-case character (``'\\r'`` for Enter, ``'\\x1b'`` for Esc), or
+    None when no key is waiting. ``wait_key`` blocks for the next key.
+    """
+
+    name = 'base'
+
+    def position(self):
+        raise NotImplementedError
+
+    def move_to(self, x, y):
+        raise NotImplementedError
+
+    def click(self, x=None, y=None):
+        raise NotImplementedError
+
+    def press_key(self, key):
+        """Press a key or chord like 'CTRL+3'; returns False if the key is unknown"""
+        raise NotImplementedError
+
+    def poll_key(self):
+        return None
+
+    def client_rect(self, title):
+        """The game window's client area as (left, top, width, height), or None when it cannot be found"""
+        return None
+
+    def dpi(self, title=None):
+        return 96
+
+    def screen_rect(self):
+        """Desktop bounds as (left, top, right, bottom), or None when unknown"""
+        return None
+
+    def wait_key(self, timeout=None):
+        """Block until a key arrives (None on timeout).
+
+        Backends without a blocking primitive fall back to polling with a
+        backoff from 10 ms to 200 ms, so an idle wait costs next to no CPU.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = 0.01
+        while True:
+            key = self.poll_key()
+            if key is not None:
+                return key
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                delay = min(delay, remaining)
+            time.sleep(delay)
+            delay = min(delay * 2, 0.2)
+
+    def close(self):
+        pass
@@ -0,0 +1,48 @@
+"""Measure per-call overhead of the input backends.
+
+    python -m rs3core.backends.bench                 # null + recording
+    python -m rs3core.backends.bench win32 --calls 5000
+
+Only ``position`` and a zero-distance ``move_to`` are timed, so running it
+against a real backend never moves the cursor or clicks anything.
+"""
+
+import argparse
+import time
+
+from . import get_backend
+
+def bench_backend(backend, calls):
+    """Return mean nanoseconds per call for position() and move_to()"""
+    x, y = backend.position()
+
+    start = time.perf_counter_ns()
+    for _ in range(calls):
+        backend.position()
+    position_ns = (time.perf_counter_ns() - start) / calls
+
+    start = time.perf_counter_ns()
+    for _ in range(calls):
+        backend.move_to(x, y)
+    move_ns = (time.perf_counter_ns() - start) / calls
+
+    return {'position_ns': position_ns, 'move_to_ns': move_ns}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time input backend call overhead")
+    parser.add_argument('backends', nargs='*', default=['null', 'recording'])
+    parser.add_argument('--calls', type=int, default=10_000)
+    args = parser.parse_args(argv)
+
+    for name in args.backends:
+        try:
+            backend = get_backend(name)
+        except ImportError as e:
+            print(f"{name:<10} unavailable ({e})")
+            continue
+        result = bench_backend(backend, args.calls)
+        backend.close()
+        print(f"{name:<10} position {result['position_ns'] / 1000:8.2f}µs   move_to {result['move_to_ns'] / 1000:8.2f}µs")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+import pyautogui
+
+from .base import InputBackend
+
+NAMED_KEYS = {'SPACE': 'space', ' ': 'space', 'ENTER': 'enter', 'CTRL': 'ctrl',
+              'SHIFT': 'shift', 'ALT': 'alt', 'ESC': 'esc', 'TAB': 'tab'}
+
+class PyAutoGUIBackend(InputBackend):
+    """pyautogui input; it has no key listener, so hotkeys are unavailable"""
+
+    name = 'pyautogui'
+
+    def __init__(self):
+        pyautogui.PAUSE = 0  # the engine paces itself; pyautogui's 0.1s per-call pause would skew paths
+
+    def _key(self, name):
+        upper = name if name == ' ' else name.upper()
+        return NAMED_KEYS.get(upper, name.lower() if len(name) == 1 else None)
+
+    def position(self):
+        return tuple(pyautogui.position())
+
+    def move_to(self, x, y):
+        pyautogui.moveTo(x, y)
+
+    def click(self, x=None, y=None):
+        if x is not None and y is not None:
+            pyautogui.click(x, y)
+        else:
+            pyautogui.click()
+
+    def screen_rect(self):
+        width, height = pyautogui.size()
+        return 0, 0, width, height
+
+    def press_key(self, key):
+        parts = key.split('+') if len(key) > 1 else [key]
+        keys = [self._key(part) for part in parts]
+        if None in keys:
+            return False
+        if len(keys) > 1:
+            pyautogui.hotkey(*keys)
+        else:
+            pyautogui.press(keys[0])
+        return True
@@ -0,0 +1,87 @@
+import queue
+import random
+import time
+
+from pynput.keyboard import Controller as KeyboardController, Key, KeyCode, Listener
+from pynput.mouse import Button, Controller as MouseController
+
+from .base import InputBackend
+
+NAMED_KEYS = {
+    'SPACE': Key.space, ' ': Key.space, 'ENTER': Key.enter, 'CTRL': Key.ctrl,
+    'SHIFT': Key.shift, 'ALT': Key.alt, 'ESC': Key.esc, 'TAB': Key.tab
+}
+
+class PynputBackend(InputBackend):
+    """pynput mouse/keyboard controllers; hotkeys come from a global listener thread"""
+
+    name = 'pynput'
+
+    def __init__(self):
+        self.mouse = MouseController()
+        self.keyboard = KeyboardController()
+        self.keys = queue.Queue()
+        self.listener = None
+
+    def _key(self, name):
+        upper = name if name == ' ' else name.upper()
+        if upper in NAMED_KEYS:
+            return NAMED_KEYS[upper]
+        if len(name) == 1:
+            return KeyCode.from_char(name.lower())
+        return None
+
+    def position(self):
+        return self.mouse.position
+
+    def move_to(self, x, y):
+        self.mouse.position = (x, y)
+
+    def click(self, x=None, y=None):
+        if x is not None and y is not None:
+            self.mouse.position = (x, y)
+        self.mouse.click(Button.left, 1)
+
+    def press_key(self, key):
+        parts = key.split('+') if len(key) > 1 else [key]
+        keys = [self._key(part) for part in parts]
+        if None in keys:
+            return False
+        for k in keys:
+            self.keyboard.press(k)
+        time.sleep(random.uniform(0.02, 0.05))
+        for k in reversed(keys):
+            self.keyboard.release(k)
+        return True
+
+    def _on_press(self, key):
+        if key == Key.enter:
+            self.keys.put('\r')
+        elif key == Key.esc:
+            self.keys.put('\x1b')
+        elif getattr(key, 'char', None):
+            self.keys.put(key.char.lower())
+
+    def _listen(self):
+        if self.listener is None:
+            self.listener = Listener(on_press=self._on_press)
+            self.listener.start()
+
+    def poll_key(self):
+        self._listen()
+        try:
+            return self.keys.get_nowait()
+        except queue.Empty:
+            return None
+
+    def wait_key(self, timeout=None):
+        self._listen()
+        try:
+            return self.keys.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
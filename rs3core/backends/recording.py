@@ -0,0 +1,86 @@
+import collections
+import time
+
+from .base import InputBackend
+
+class NullBackend(InputBackend):
+    """Headless backend: tracks the cursor in memory and emits nothing.
+
+    ``keys`` is an optional sequence of hotkeys handed out one per
+    ``poll_key`` call, so a routine can be started and stopped unattended.
+    ``client`` stands in for the game window's (left, top, width, height),
+    and can be reassigned to act out the window moving.
+    """
+
+    name = 'null'
+
+    def __init__(self, start=(0, 0), keys=(), client=None, screen=(0, 0, 1920, 1080)):
+        self.cursor = tuple(start)
+        self.keys = collections.deque(keys)
+        self.client = client
+        self.screen = screen
+
+    def position(self):
+        return self.cursor
+
+    def move_to(self, x, y):
+        self.cursor = (int(x), int(y))
+
+    def click(self, x=None, y=None):
+        if x is not None and y is not None:
+            self.move_to(x, y)
+
+    def press_key(self, key):
+        return True
+
+    def poll_key(self):
+        return self.keys.popleft() if self.keys else None
+
+    def client_rect(self, title):
+        return self.client
+
+    def screen_rect(self):
+        return self.screen
+
+    def wait_key(self, timeout=None):
+        # Scripted keys are all there is; blocking on an empty script would hang forever
+        return self.poll_key()
+
+class RecordingBackend(NullBackend):
+    """NullBackend that also logs every call as ``(t_ns, kind, x, y, detail)``.
+
+    Events go into a bounded deque so long headless runs cannot grow without
+    limit, while ``counts`` keeps running totals per kind. ``clock`` defaults
+    to perf_counter_ns and can be swapped for a simulated one.
+    """
+
+    name = 'recording'
+
+    def __init__(self, start=(0, 0), keys=(), capacity=100_000, clock=time.perf_counter_ns, **kwargs):
+        super().__init__(start, keys, **kwargs)
+        self.events = collections.deque(maxlen=capacity)
+        self.counts = collections.Counter()
+        self.clock = clock
+
+    def _record(self, kind, detail=None):
+        self.events.append((self.clock(), kind, self.cursor[0], self.cursor[1], detail))
+        self.counts[kind] += 1
+
+    def move_to(self, x, y):
+        super().move_to(x, y)
+        self._record('move')
+
+    def click(self, x=None, y=None):
+        super().click(x, y)
+        self._record('click')
+
+    def press_key(self, key):
+        self._record('key', key)
+        return True
+
+    def count(self, kind):
+        return self.counts[kind]
+
+    def clear(self):
+        self.events.clear()
+        self.counts.clear()
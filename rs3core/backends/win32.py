@@ -0,0 +1,55 @@
+import ctypes
+import msvcrt
+
+from .. import win32input
+from .base import InputBackend
+
+class Win32Backend(InputBackend):
+    """SendInput/SetCursorPos input with console hotkeys read through msvcrt"""
+
+    name = 'win32'
+
+    def __init__(self):
+        win32input.enable_dpi_awareness()
+        self.hwnd = None
+
+    def position(self):
+        return win32input.get_current_mouse_position()
+
+    def move_to(self, x, y):
+        win32input.set_mouse_position(x, y)
+
+    def click(self, x=None, y=None):
+        win32input.send_native_click(x, y)
+
+    def press_key(self, key):
+        return win32input.send_key_press(key)
+
+    def _window(self, title):
+        if not (self.hwnd and ctypes.windll.user32.IsWindow(self.hwnd)):
+            self.hwnd = win32input.find_window(title)
+        return self.hwnd
+
+    def client_rect(self, title):
+        hwnd = self._window(title)
+        return win32input.get_client_rect(hwnd) if hwnd else None
+
+    def dpi(self, title=None):
+        hwnd = self._window(title) if title else None
+        return win32input.get_window_dpi(hwnd) if hwnd else win32input.DEFAULT_DPI
+
+    def screen_rect(self):
+        return win32input.get_virtual_screen()
+
+    def poll_key(self):
+        if not msvcrt.kbhit():
+            return None
+        return self._read_key()
+
+    def wait_key(self, timeout=None):
+        if timeout is None:
+            return self._read_key()  # getch blocks in the console read, no polling
+        return super().wait_key(timeout)
+
+    def _read_key(self):
+        return msvcrt.getch().decode('utf-8', errors='ignore').lower()
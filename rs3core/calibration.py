@@ -0,0 +1,76 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+ENTER_KEYS = ('\r', '\n')
+ESC_KEY = '\x1b'
+
+class CalibrationCancelled(Exception):
+    pass
+
+# ─── Calibration ──────────────────────────────────────────────────────────────
+def capture_point(backend, prompt, keys=None):
+    """Block (no busy loop) until Enter, then return the cursor position; Esc cancels.
+
+    Keys are read from ``keys`` (anything with ``wait_key``, e.g. the hotkey
+    service) or straight from the backend.
+    """
+    print(prompt)
+    while True:
+        key = (keys or backend).wait_key()
+        if key in ENTER_KEYS:
+            return backend.position()
+        if key is None or key == ESC_KEY:
+            raise CalibrationCancelled()
+
+def calibrate_region(backend, name, keys=None):
+    x1, y1 = capture_point(backend, f"Move mouse to TOP-LEFT of {name} and press Enter (Esc to cancel)...", keys)
+    x2, y2 = capture_point(backend, f"Move mouse to BOTTOM-RIGHT of {name} and press Enter (Esc to cancel)...", keys)
+    # Corners captured in the wrong order still give a valid box
+    region = (min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
+    print(f"{name} region: {region}")
+    return region
+
+def region_steps(steps):
+    """Steps that need a calibrated region, one per distinct region_key.
+
+    Regions only watched by an ``until`` condition (say, the inventory) are
+    yielded as small stand-in steps so they get calibrated too.
+    """
+    seen = set()
+    for step in steps:
+        key = step.get('region_key')
+        if key and key not in seen:
+            seen.add(key)
+            yield step
+        until = step.get('until')
+        for condition in until.leaves() if until is not None else ():
+            watched = condition.region
+            if isinstance(watched, str) and watched not in seen:
+                seen.add(watched)
+                yield {'name': watched.replace('_REGION', '').replace('_', ' ').title(), 'region_key': watched}
+
+def calibrate_all_regions(backend, steps, store, title="Calibration Mode", only=None, keys=None):
+    """One pass over every step that needs a region, saving them together at the end.
+
+    ``only`` limits the pass to those region keys; regions already saved for
+    other steps are kept, and only the recalibrated rows of the ``store``
+    (a ``RegionStore``) are rewritten. Esc aborts without saving anything
+    and returns what was saved before.
+    """
+    print(f"\n--- {title} ---")
+    saved = store.load()
+    regions = dict(saved or {})
+    calibrated = []
+    try:
+        for step in region_steps(steps):
+            if only is None or step['region_key'] in only:
+                regions[step['region_key']] = calibrate_region(backend, step['name'], keys)
+                calibrated.append(step['region_key'])
+    except CalibrationCancelled:
+        print("Calibration cancelled - saved regions left unchanged.")
+        return saved
+
+    regions = store.save(regions, keys=calibrated if only is not None else None)
+    print(f"Regions saved to {store.db.path} ({store.routine})!")
+    return regions
@@ -0,0 +1,135 @@
+import io
+import json
+import os
+import threading
+import time
+
+DEFAULT_PROFILE = 'default'
+DEFAULT_DATABASE = os.path.join(os.path.expanduser('~'), '.rs3core', 'calibrations.db')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS calibrations (
+    routine    TEXT NOT NULL,
+    profile    TEXT NOT NULL,
+    resolution TEXT NOT NULL,
+    client     TEXT,
+    dpi        INTEGER,
+    screen     TEXT,
+    updated    REAL NOT NULL,
+    PRIMARY KEY (routine, profile, resolution)
+);
+CREATE TABLE IF NOT EXISTS regions (
+    routine    TEXT NOT NULL,
+    profile    TEXT NOT NULL,
+    resolution TEXT NOT NULL,
+    key        TEXT NOT NULL,
+    x1 REAL NOT NULL, y1 REAL NOT NULL, x2 REAL NOT NULL, y2 REAL NOT NULL,
+    PRIMARY KEY (routine, profile, resolution, key)
+);
+CREATE TABLE IF NOT EXISTS references_ (
+    routine TEXT NOT NULL,
+    profile TEXT NOT NULL,
+    key     TEXT NOT NULL,
+    frame   BLOB NOT NULL,
+    PRIMARY KEY (routine, profile, key)
+);
+"""
+
+def routine_key(region_file):
+    """The name a routine's calibration is filed under: its old region file's stem"""
+    return os.path.splitext(os.path.basename(region_file))[0]
+
+def resolution_key(screen):
+    return f"{screen[2] - screen[0]}x{screen[3] - screen[1]}" if screen else 'any'
+
+# sqlite3 and NumPy are imported on first use, keeping them out of a script's import time
+def _pack_frame(frame):
+    import numpy as np
+    buffer = io.BytesIO()
+    np.save(buffer, np.ascontiguousarray(frame))
+    return buffer.getvalue()
+
+def _unpack_frame(blob):
+    import numpy as np
+    return np.load(io.BytesIO(blob))
+
+# ─── Calibration Database ─────────────────────────────────────────────────────
+class CalibrationDB:
+    """Every routine's regions and reference snapshots in one SQLite file.
+
+    Rows are keyed by routine, profile (one per account or client setup)
+    and screen resolution, so a read pulls only the routine being run and
+    a recalibration of a few regions rewrites just those rows, in one
+    transaction. The file lives in the user's home directory (or
+    ``RS3CORE_CALIBRATIONS``) rather than the working directory, and is
+    not opened until first used.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or os.environ.get('RS3CORE_CALIBRATIONS', DEFAULT_DATABASE)
+        self.connection = None
+        self.lock = threading.Lock()
+
+    def _connect(self):
+        if self.connection is None:
+            import sqlite3
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            self.connection = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False)
+            self.connection.execute('PRAGMA journal_mode=WAL')
+            self.connection.executescript(SCHEMA)
+        return self.connection
+
+    def load_regions(self, routine, profile, resolution):
+        """``{'resolution', 'client', 'dpi', 'screen', 'regions'}`` for ``resolution``, else the newest
+        calibration at any resolution, else None"""
+        with self.lock:
+            db = self._connect()
+            row = db.execute(
+                "SELECT resolution, client, dpi, screen FROM calibrations WHERE routine = ? AND profile = ? "
+                "ORDER BY resolution = ? DESC, updated DESC LIMIT 1", (routine, profile, resolution)).fetchone()
+            if row is None:
+                return None
+            boxes = db.execute("SELECT key, x1, y1, x2, y2 FROM regions WHERE routine = ? AND profile = ? "
+                               "AND resolution = ?", (routine, profile, row[0])).fetchall()
+        return {
+            'resolution': row[0],
+            'client': json.loads(row[1]) if row[1] else None,
+            'dpi': row[2],
+            'screen': json.loads(row[3]) if row[3] else None,
+            'regions': {key: [x1, y1, x2, y2] for key, x1, y1, x2, y2 in boxes},
+        }
+
+    def save_regions(self, routine, profile, record, keys=None):
+        """Write ``record`` under its resolution; only the ``keys`` rows when given, else replace them all"""
+        resolution = record['resolution']
+        regions = record['regions']
+        with self.lock, self._connect() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO calibrations VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (routine, profile, resolution, json.dumps(record['client']) if record['client'] else None,
+                 record['dpi'], json.dumps(record['screen']) if record['screen'] else None, time.time()))
+            if keys is None:
+                db.execute("DELETE FROM regions WHERE routine = ? AND profile = ? AND resolution = ?",
+                           (routine, profile, resolution))
+                keys = regions
+            db.executemany("INSERT OR REPLACE INTO regions VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                           [(routine, profile, resolution, key, *regions[key]) for key in keys])
+
+    def load_references(self, routine, profile):
+        with self.lock:
+            rows = self._connect().execute("SELECT key, frame FROM references_ WHERE routine = ? AND profile = ?",
+                                           (routine, profile)).fetchall()
+        return {key: _unpack_frame(blob) for key, blob in rows}
+
+    def save_references(self, routine, profile, references):
+        """Add or replace the snapshots in ``references``; others for the routine are kept"""
+        rows = [(routine, profile, key, _pack_frame(frame)) for key, frame in references.items()]
+        with self.lock, self._connect() as db:
+            db.executemany("INSERT OR REPLACE INTO references_ VALUES (?, ?, ?, ?)", rows)
+
+    def close(self):
+        with self.lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
@@ -0,0 +1,57 @@
+"""Screen capture: where step conditions get their pixels from.
+
+Like the input backends, captures are imported lazily: ``win32`` is plain
+ctypes/GDI, ``mss`` needs the ``mss`` package, ``replay`` plays recorded
+.npy/.png frames (``RS3CORE_REPLAY`` names them) and ``null`` captures
+nothing. When the platform default cannot be loaded the routine falls back
+to ``null`` and simply waits out each step's full duration, as before.
+``RS3CORE_CAPTURE`` overrides the choice.
+"""
+
+import importlib
+import logging
+import os
+import sys
+
+from .base import NullCapture, ScreenCapture, region_size
+from .cache import CachedCapture, merge_regions
+
+logger = logging.getLogger(__name__)
+
+CAPTURES = {
+    'win32': ('.win32', 'Win32Capture'),
+    'mss': ('.mss', 'MssCapture'),
+    'replay': ('.replay', 'ReplayCapture'),
+    'null': ('.base', 'NullCapture'),
+}
+
+def default_capture_name():
+    return 'win32' if sys.platform == 'win32' else 'mss'
+
+def get_capture(capture=None, **kwargs):
+    """Resolve a capture name (or None for the platform default) to an instance; instances pass through"""
+    if isinstance(capture, ScreenCapture):
+        return capture
+    name = os.environ.get('RS3CORE_CAPTURE') or capture or default_capture_name()
+    if name not in CAPTURES:
+        raise ValueError(f"Unknown screen capture '{name}' (choose from {', '.join(CAPTURES)})")
+    module_name, class_name = CAPTURES[name]
+    try:
+        module = importlib.import_module(module_name, __name__)
+        return getattr(module, class_name)(**kwargs)
+    except ImportError as e:
+        if capture is not None:
+            raise
+        logger.warning(f"⚠️  Screen capture '{name}' unavailable ({e}); steps will use their full durations")
+        return NullCapture()
+
+__all__ = [
+    'CAPTURES',
+    'CachedCapture',
+    'NullCapture',
+    'ScreenCapture',
+    'default_capture_name',
+    'get_capture',
+    'merge_regions',
+    'region_size',
+]
@@ -0,0 +1,39 @@
+class ScreenCapture:
+    """Grabs screen rectangles as ``(height, width, 3)`` uint8 RGB arrays.
+
+    Regions are the same ``(x1, y1, x2, y2)`` pixel boxes calibration
+    stores, and only that rectangle is read from the screen. ``grab``
+    returns None when nothing can be captured, and callers treat that as
+    "no information" (fall back to timers).
+
+    The array is a view over a buffer the capture keeps per region and
+    refills on the next grab of that region, so steady-state grabs allocate
+    nothing; ``copy()`` it to keep a frame.
+    """
+
+    name = 'base'
+
+    def grab(self, region):
+        raise NotImplementedError
+
+    def prefetch(self, regions):
+        """Hint that ``regions`` are about to be grabbed together; captures that can share work override this"""
+
+    def close(self):
+        pass
+
+# Buffers are kept per region; one-off boxes (auto-locate search windows)
+# would otherwise pile up, so captures drop the oldest beyond this many.
+MAX_BUFFERS = 32
+
+def region_size(region):
+    x1, y1, x2, y2 = (int(v) for v in region)
+    return max(1, x2 - x1), max(1, y2 - y1)
+
+class NullCapture(ScreenCapture):
+    """No screen at all (simulation, headless runs): every grab is None"""
+
+    name = 'null'
+
+    def grab(self, region):
+        return None
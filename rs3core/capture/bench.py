@@ -0,0 +1,85 @@
+"""Measure grab cost and per-grab allocation of the screen captures.
+
+    python -m rs3core.capture.bench bonfire-automation-regions
+    python -m rs3core.capture.bench harp-regions --profile alt --capture replay --replay frames/ --grabs 2000
+    python -m rs3core.capture.bench old-regions.json
+
+Every calibrated region of the routine (named as in the calibration
+database, i.e. its region file's stem) is grabbed ``--grabs`` times, at
+where the game window puts it now. A path ending in ``.json`` reads an old
+region file instead. Allocation is measured with tracemalloc after a
+warm-up grab, so a capture that reuses its buffers reports roughly zero
+bytes per grab.
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+
+from . import get_capture
+from ..backends import get_backend
+from ..calibration_db import CalibrationDB
+from ..regions import RegionStore, load_region_file
+
+def bench_capture(capture, regions, grabs):
+    """Return {region_key: (mean µs per grab, bytes allocated per grab, frame shape)}"""
+    results = {}
+    for key, region in regions.items():
+        frame = capture.grab(region)
+        if frame is None:
+            results[key] = None
+            continue
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter_ns()
+        for _ in range(grabs):
+            capture.grab(region)
+        elapsed = time.perf_counter_ns() - start
+        allocated = tracemalloc.get_traced_memory()[1] - before
+        tracemalloc.stop()
+        results[key] = (elapsed / grabs / 1000, allocated / grabs, frame.shape)
+    return results
+
+def load_regions(args):
+    """Screen boxes for the routine named on the command line, read without writing anything"""
+    if args.regions.lower().endswith('.json'):
+        return load_region_file(args.regions)
+    backend = get_backend(args.backend)
+    db = CalibrationDB(args.calibrations)
+    try:
+        return RegionStore(args.regions, backend, db=db, profile=args.profile).load(import_legacy=False)
+    finally:
+        db.close()
+        backend.close()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time region grabs for a calibrated routine")
+    parser.add_argument('regions', help="routine to bench, as named in the calibration database (its region "
+                                        "file's stem), or the path of an old *-regions.json file")
+    parser.add_argument('--profile', default=None, help="calibration profile (RS3CORE_PROFILE or 'default')")
+    parser.add_argument('--calibrations', default=None, help="calibration database (RS3CORE_CALIBRATIONS or "
+                                                             "~/.rs3core/calibrations.db)")
+    parser.add_argument('--backend', default=None, help="input backend used to find the game window "
+                                                        "(platform default if omitted; 'null' for regions as calibrated)")
+    parser.add_argument('--capture', default=None, help="capture name (platform default if omitted)")
+    parser.add_argument('--replay', default=None, help="frames for --capture replay (directory, .npy or .png)")
+    parser.add_argument('--grabs', type=int, default=500)
+    args = parser.parse_args(argv)
+
+    regions = load_regions(args)
+    if not regions:
+        sys.exit(f"No calibrated regions found for {args.regions}")
+    kwargs = {'source': args.replay} if args.replay else {}
+    capture = get_capture(args.capture, **kwargs)
+    print(f"capture: {capture.name}")
+    for key, result in bench_capture(capture, regions, args.grabs).items():
+        if result is None:
+            print(f"{key:<40} no frame")
+            continue
+        micros, allocated, shape = result
+        print(f"{key:<40} {shape[1]:>4}x{shape[0]:<4} {micros:8.1f}µs/grab {allocated:8.0f} B/grab")
+    capture.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+import threading
+import time
+
+from .base import MAX_BUFFERS, ScreenCapture
+
+def box_area(box):
+    return max(0, box[2] - box[0]) * max(0, box[3] - box[1])
+
+def box_union(a, b):
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+
+def box_contains(outer, inner):
+    return outer[0] <= inner[0] and outer[1] <= inner[1] and outer[2] >= inner[2] and outer[3] >= inner[3]
+
+def merge_regions(regions, slack=0.25):
+    """Group boxes whose union costs at most ``slack`` more pixels than grabbing them apart"""
+    boxes = []
+    for region in regions:
+        box = tuple(int(v) for v in region)
+        while True:
+            for i, other in enumerate(boxes):
+                union = box_union(box, other)
+                if box_area(union) <= (box_area(box) + box_area(other)) * (1 + slack):
+                    box = union
+                    del boxes[i]
+                    break
+            else:
+                break
+        boxes.append(box)
+    return boxes
+
+class CachedCapture(ScreenCapture):
+    """Shares grabs between detectors reading the screen in the same tick.
+
+    A frame is reused for ``ttl`` seconds. ``prefetch`` merges overlapping
+    or adjacent regions into union boxes and grabs each union once; every
+    region inside a fresh union is then served as a slice of it, so N
+    detectors in one loop iteration cost one grab per union rather than N.
+    Frames are views, valid until the next tick, like the wrapped capture's.
+    Grabs are serialised, so the sensing thread and the hotkey thread
+    (calibration, auto-locate) can share one capture.
+    """
+
+    def __init__(self, capture, ttl=0.05, clock=time.monotonic):
+        self.capture = capture
+        self.name = capture.name
+        self.ttl = ttl
+        self.clock = clock
+        self.entries = {}
+        self.grabs = 0
+        self.hits = 0
+        self.lock = threading.RLock()
+
+    def _store(self, box, now):
+        frame = self.capture.grab(box)
+        self.grabs += 1
+        if frame is not None:
+            if len(self.entries) >= MAX_BUFFERS:
+                self.entries.pop(next(iter(self.entries)))
+            self.entries[box] = (now, frame)
+        return frame
+
+    def _fresh(self, now):
+        stale = [box for box, (taken, _) in self.entries.items() if now - taken > self.ttl]
+        for box in stale:
+            del self.entries[box]
+        return self.entries
+
+    def prefetch(self, regions):
+        with self.lock:
+            self._prefetch(regions)
+
+    def _prefetch(self, regions):
+        now = self.clock()
+        entries = self._fresh(now)
+        wanted = [tuple(int(v) for v in region) for region in regions if region]
+        missing = [box for box in wanted if not any(box_contains(held, box) for held in entries)]
+        for box in merge_regions(missing):
+            self._store(box, now)
+
+    def grab(self, region):
+        with self.lock:
+            return self._grab(region)
+
+    def _grab(self, region):
+        box = tuple(int(v) for v in region)
+        now = self.clock()
+        for held, (_, frame) in self._fresh(now).items():
+            if box_contains(held, box):
+                self.hits += 1
+                x, y = box[0] - held[0], box[1] - held[1]
+                return frame[y:y + max(1, box[3] - box[1]), x:x + max(1, box[2] - box[0])]
+        return self._store(box, now)
+
+    def close(self):
+        with self.lock:
+            self.entries.clear()
+            self.capture.close()
@@ -0,0 +1,45 @@
+import threading
+
+import numpy as np
+
+from .base import MAX_BUFFERS, ScreenCapture, region_size
+
+class MssCapture(ScreenCapture):
+    """Cross-platform capture through the ``mss`` package (macOS/Linux).
+
+    mss hands back a fresh bytes object per shot; its pixels are copied into
+    a buffer kept per region, so what callers see is still a reused view.
+    """
+
+    name = 'mss'
+
+    def __init__(self):
+        import mss
+        self._mss = mss
+        self._local = threading.local()
+        self.buffers = {}
+
+    def grab(self, region):
+        # mss handles are tied to the thread that made them, so each thread opens its own
+        sct = getattr(self._local, 'sct', None)
+        if sct is None:
+            sct = self._local.sct = self._mss.mss()
+        key = tuple(int(v) for v in region)
+        width, height = region_size(key)
+        shot = sct.grab({'left': key[0], 'top': key[1], 'width': width, 'height': height})
+        # On HiDPI displays the shot can come back larger than the requested box
+        pixels = np.frombuffer(shot.raw, np.uint8).reshape(shot.height, shot.width, 4)
+        buffer = self.buffers.get(key)
+        if buffer is None or buffer.shape != pixels.shape:
+            if buffer is None and len(self.buffers) >= MAX_BUFFERS:
+                self.buffers.pop(next(iter(self.buffers)))
+            buffer = self.buffers[key] = np.empty_like(pixels)
+        np.copyto(buffer, pixels)
+        return buffer[..., 2::-1]  # BGRA -> RGB view
+
+    def close(self):
+        sct = getattr(self._local, 'sct', None)
+        if sct is not None:
+            sct.close()
+            self._local.sct = None
+        self.buffers.clear()
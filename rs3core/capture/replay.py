@@ -0,0 +1,92 @@
+import os
+import time
+
+import numpy as np
+
+from .base import ScreenCapture
+
+FRAME_EXTENSIONS = ('.npy', '.png')
+
+def load_frames(source):
+    """Frames as a list of ``(height, width, 3+)`` uint8 arrays.
+
+    ``source`` is a directory of ``.npy``/``.png`` files (played in name
+    order), a single ``.npy`` holding an ``(n, height, width, channels)``
+    stack, or such an array. ``.npy`` files are memory-mapped, so frames are
+    only paged in as regions of them are read. PNG decoding needs Pillow.
+    """
+    if isinstance(source, np.ndarray):
+        return list(source) if source.ndim == 4 else [source]
+    if os.path.isdir(source):
+        names = sorted(name for name in os.listdir(source) if name.lower().endswith(FRAME_EXTENSIONS))
+        return [frame for name in names for frame in load_frames(os.path.join(source, name))]
+    if source.lower().endswith('.npy'):
+        return load_frames(np.load(source, mmap_mode='r'))
+    if source.lower().endswith('.png'):
+        from PIL import Image
+        with Image.open(source) as image:
+            return [np.asarray(image.convert('RGB'))]
+    raise ValueError(f"Don't know how to replay {source!r} (expected a directory, .npy or .png)")
+
+def save_frames(capture, region, directory, count, interval=0.1, sleep=time.sleep):
+    """Record ``count`` grabs of ``region`` as numbered .npy files, for replaying later.
+
+    Replay them with ``origin=region[:2]`` so calibrated regions inside the
+    recorded box line up.
+    """
+    os.makedirs(directory, exist_ok=True)
+    saved = 0
+    for i in range(count):
+        frame = capture.grab(region)
+        if frame is not None:
+            np.save(os.path.join(directory, f"frame_{i:05d}.npy"), np.ascontiguousarray(frame))
+            saved += 1
+        sleep(interval)
+    return saved
+
+class ReplayCapture(ScreenCapture):
+    """Plays recorded frames back as if they were the screen.
+
+    Lets detection code be developed and benchmarked on a machine with no
+    game client. ``origin`` is the screen position of each frame's top-left
+    pixel, so calibrated regions crop the right part. With ``fps`` the
+    current frame follows ``clock``; without it every grab moves on one
+    frame. Grabs are slices of the loaded frames (no copies); the source is
+    read from ``RS3CORE_REPLAY`` when not given.
+    """
+
+    name = 'replay'
+
+    def __init__(self, source=None, origin=(0, 0), fps=None, loop=True, clock=time.perf_counter):
+        source = source if source is not None else os.environ.get('RS3CORE_REPLAY')
+        if source is None:
+            raise ValueError("ReplayCapture needs frames: pass source= or set RS3CORE_REPLAY")
+        self.frames = load_frames(source)
+        if not self.frames:
+            raise ValueError(f"No frames found in {source!r}")
+        self.origin = origin
+        self.fps = fps
+        self.loop = loop
+        self.clock = clock
+        self.start = clock()
+        self.index = -1
+
+    def frame_index(self):
+        if self.fps:
+            index = int((self.clock() - self.start) * self.fps)
+        else:
+            self.index += 1
+            index = self.index
+        if self.loop:
+            return index % len(self.frames)
+        return min(index, len(self.frames) - 1)
+
+    def grab(self, region):
+        frame = self.frames[self.frame_index()]
+        x1, y1, x2, y2 = (int(v) for v in region)
+        ox, oy = self.origin
+        x1, x2 = x1 - ox, max(x1 - ox + 1, x2 - ox)
+        y1, y2 = y1 - oy, max(y1 - oy + 1, y2 - oy)
+        if x1 < 0 or y1 < 0 or x2 > frame.shape[1] or y2 > frame.shape[0]:
+            return None
+        return frame[y1:y2, x1:x2, :3]
@@ -0,0 +1,118 @@
+import ctypes
+import weakref
+from ctypes import wintypes
+
+import numpy as np
+
+from .base import MAX_BUFFERS, ScreenCapture, region_size
+
+SRCCOPY = 0x00CC0020
+DIB_RGB_COLORS = 0
+BI_RGB = 0
+
+class BITMAPINFOHEADER(ctypes.Structure):
+    _fields_ = [
+        ('biSize', wintypes.DWORD),
+        ('biWidth', wintypes.LONG),
+        ('biHeight', wintypes.LONG),
+        ('biPlanes', wintypes.WORD),
+        ('biBitCount', wintypes.WORD),
+        ('biCompression', wintypes.DWORD),
+        ('biSizeImage', wintypes.DWORD),
+        ('biXPelsPerMeter', wintypes.LONG),
+        ('biYPelsPerMeter', wintypes.LONG),
+        ('biClrUsed', wintypes.DWORD),
+        ('biClrImportant', wintypes.DWORD),
+    ]
+
+class BITMAPINFO(ctypes.Structure):
+    _fields_ = [('bmiHeader', BITMAPINFOHEADER), ('bmiColors', wintypes.DWORD * 3)]
+
+user32 = ctypes.windll.user32
+gdi32 = ctypes.windll.gdi32
+
+# Handles are pointer-sized; without these ctypes truncates them to 32 bits
+user32.GetDC.restype = wintypes.HDC
+user32.GetDC.argtypes = [wintypes.HWND]
+user32.ReleaseDC.argtypes = [wintypes.HWND, wintypes.HDC]
+gdi32.CreateCompatibleDC.restype = wintypes.HDC
+gdi32.CreateCompatibleDC.argtypes = [wintypes.HDC]
+gdi32.CreateDIBSection.restype = wintypes.HBITMAP
+gdi32.CreateDIBSection.argtypes = [wintypes.HDC, ctypes.c_void_p, wintypes.UINT,
+                                   ctypes.POINTER(ctypes.c_void_p), wintypes.HANDLE, wintypes.DWORD]
+gdi32.SelectObject.restype = wintypes.HGDIOBJ
+gdi32.SelectObject.argtypes = [wintypes.HDC, wintypes.HGDIOBJ]
+gdi32.BitBlt.argtypes = [wintypes.HDC, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+                         wintypes.HDC, ctypes.c_int, ctypes.c_int, wintypes.DWORD]
+gdi32.DeleteObject.argtypes = [wintypes.HGDIOBJ]
+gdi32.DeleteDC.argtypes = [wintypes.HDC]
+
+def _free_surface(dc, previous, bitmap):
+    gdi32.SelectObject(dc, previous)
+    gdi32.DeleteObject(bitmap)
+    gdi32.DeleteDC(dc)
+
+class _Surface:
+    """Memory DC with a DIB section selected into it; ``pixels`` is NumPy over the DIB's own memory.
+
+    Frames handed out are views of that memory and may outlive the surface
+    (a capture cache, or a caller, can still hold one), so the DIB is freed
+    only once the last view of it is gone, never while one is reachable.
+    """
+
+    def __init__(self, screen_dc, width, height):
+        self.dc = gdi32.CreateCompatibleDC(screen_dc)
+        info = BITMAPINFO()
+        # Negative height asks for top-down rows, matching NumPy's layout
+        info.bmiHeader = BITMAPINFOHEADER(ctypes.sizeof(BITMAPINFOHEADER), width, -height, 1, 32, BI_RGB)
+        bits = ctypes.c_void_p()
+        self.bitmap = gdi32.CreateDIBSection(self.dc, ctypes.byref(info), DIB_RGB_COLORS, ctypes.byref(bits), None, 0)
+        if not self.bitmap or not bits.value:
+            gdi32.DeleteDC(self.dc)
+            raise OSError(f"CreateDIBSection failed for {width}x{height}")
+        self.previous = gdi32.SelectObject(self.dc, self.bitmap)
+        buffer = (ctypes.c_uint8 * (width * height * 4)).from_address(bits.value)
+        self.pixels = np.ctypeslib.as_array(buffer).reshape(height, width, 4)
+        self.rgb = self.pixels[..., 2::-1]  # BGRA -> RGB view, no copy
+        # Every view of the pixels keeps ``buffer`` alive; it is collected (and the DIB freed) after the last one
+        weakref.finalize(buffer, _free_surface, self.dc, self.previous, self.bitmap)
+
+    def close(self):
+        """Drop the surface's own views; the DIB goes as soon as nothing else holds one"""
+        self.pixels = self.rgb = None
+
+class Win32Capture(ScreenCapture):
+    """GDI BitBlt of just the requested rectangle straight into a reused DIB section.
+
+    Each region gets its own surface on first use; after that a grab is one
+    BitBlt into memory NumPy already wraps, with no allocation or GetDIBits
+    copy. No extra packages needed.
+    """
+
+    name = 'win32'
+
+    def __init__(self):
+        self.screen_dc = user32.GetDC(None)
+        self.surfaces = {}
+
+    def grab(self, region):
+        key = tuple(int(v) for v in region)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            if len(self.surfaces) >= MAX_BUFFERS:
+                self.surfaces.pop(next(iter(self.surfaces))).close()
+            width, height = region_size(key)
+            surface = self.surfaces[key] = _Surface(self.screen_dc, width, height)
+        height, width = surface.pixels.shape[:2]
+        if not gdi32.BitBlt(surface.dc, 0, 0, width, height, self.screen_dc, key[0], key[1], SRCCOPY):
+            return None
+        gdi32.GdiFlush()  # make sure GDI has finished writing before NumPy reads the bits
+        return surface.rgb
+
+    def close(self):
+        for surface in self.surfaces.values():
+            surface.close()
+        self.surfaces.clear()
+        if self.screen_dc:
+            user32.ReleaseDC(None, self.screen_dc)
+            self.screen_dc = None
@@ -0,0 +1,75 @@
+import heapq
+import itertools
+import time
+
+from .timing import wait_until
+
+# ─── Clocks ───────────────────────────────────────────────────────────────────
+class SystemClock:
+    """Wall-clock time; what every routine uses outside of simulation"""
+
+    realtime = True
+
+    def time(self):
+        return time.time()
+
+    def perf_counter_ns(self):
+        return time.perf_counter_ns()
+
+    def sleep(self, seconds):
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def wait_until(self, deadline_ns):
+        wait_until(deadline_ns)
+
+    def wait(self, event, seconds):
+        """Block until ``event`` is set or ``seconds`` pass; True if the event fired"""
+        return event.wait(max(0.0, seconds))
+
+class SimulatedClock:
+    """Virtual time that jumps forward instantly instead of sleeping.
+
+    Callbacks registered with ``at`` fire as soon as virtual time reaches
+    them, which is how a simulation ends a run after N hours. Only meant to
+    be driven from one thread.
+    """
+
+    realtime = False
+
+    def __init__(self, start=0.0):
+        self.now = float(start)
+        self.slept = 0.0
+        self.timers = []
+        self._order = itertools.count()
+
+    def time(self):
+        return self.now
+
+    def perf_counter_ns(self):
+        return int(self.now * 1e9)
+
+    def at(self, when, callback):
+        heapq.heappush(self.timers, (when, next(self._order), callback))
+
+    def advance(self, seconds):
+        if seconds <= 0:
+            return
+        self.now += seconds
+        self.slept += seconds
+        while self.timers and self.timers[0][0] <= self.now:
+            _, _, callback = heapq.heappop(self.timers)
+            callback()
+
+    def sleep(self, seconds):
+        self.advance(seconds)
+
+    def wait_until(self, deadline_ns):
+        self.advance(deadline_ns / 1e9 - self.now)
+
+    def wait(self, event, seconds):
+        if not event.is_set():
+            self.advance(seconds)
+        return event.is_set()
+
+SYSTEM_CLOCK = SystemClock()
@@ -0,0 +1,964 @@
+import gc
+import logging
+import os
+import random
+import re
+import sys
+import threading
+import time
+from functools import cached_property
+
+from .backends import get_backend
+from .capture import CachedCapture, get_capture
+from .clock import SYSTEM_CLOCK
+from .calibration import calibrate_all_regions, region_steps
+from .calibration_db import CalibrationDB
+from .hotkeys import HotkeyService, backend_keys, win32_global_hotkeys
+from . import journal as session_journal
+from .metrics import MetricsRegistry
+from .profiler import DEFAULT_PROFILE_DIR, SamplingProfiler, profile_path
+from .regions import GAME_WINDOW_TITLE, RegionStore
+from .scheduler import Scheduler
+from .timing import high_resolution_timer
+
+logger = logging.getLogger(__name__)
+
+START_STOP_KEY    = '`'
+EXIT_KEY          = '~'
+CALIBRATION_KEY   = 'c'
+TOGGLE_BREAKS_KEY = 'b'
+AUTO_LOCATE_KEY   = 'l'
+PROFILE_KEY       = 'p'
+
+STARTUP_BUDGET_MS = 250
+
+# Indexes into Routine.cycle_parts
+MOVING, ACTING, WAITING = range(3)
+
+def format_time(seconds):
+    hours, remainder = divmod(int(seconds), 3600)
+    minutes, seconds = divmod(remainder, 60)
+    if hours > 0:
+        return f"{hours}h {minutes}m {seconds}s"
+    elif minutes > 0:
+        return f"{minutes}m {seconds}s"
+    else:
+        return f"{seconds}s"
+
+def step_slug(step):
+    return re.sub(r'[^a-z0-9]+', '_', step['name'].lower()).strip('_')
+
+def stat_key(step):
+    """Counter name for a step: explicit 'stat' or derived from its name"""
+    if 'stat' in step:
+        return step['stat']
+    kind = 'clicks' if step.get('region_key') else 'keybinds'
+    return f"total_{step_slug(step)}_{kind}"
+
+def describe_percentiles(histogram):
+    if not histogram.count:
+        return "-"
+    return "/".join(f"{value:.2f}" for value in histogram.percentiles()) + "s"
+
+class StepTimings:
+    """Where one step's time goes: moving to its region, clicking or pressing keys, and waiting after.
+
+    Metrics are named by position as well as name, since a course can
+    repeat the same obstacle with different waits.
+    """
+
+    __slots__ = ('number', 'move', 'act', 'wait_planned', 'wait')
+
+    def __init__(self, metrics, step, index):
+        self.number = index + 1
+        slug = f"{index + 1:02d}_{step_slug(step)}"
+        self.move = metrics.histogram(f"step_{slug}_move_seconds", f"{step['name']}: cursor move")
+        self.act = metrics.histogram(f"step_{slug}_act_seconds", f"{step['name']}: click or key presses")
+        self.wait_planned = metrics.histogram(f"step_{slug}_wait_planned_seconds", f"{step['name']}: wait drawn")
+        self.wait = metrics.histogram(f"step_{slug}_wait_seconds", f"{step['name']}: wait actually spent")
+
+def describe_duration(duration):
+    return f"{duration[0]:.1f}-{duration[1]:.1f}s"
+
+def describe_interval(interval):
+    if interval[1] >= 120:
+        return f"{interval[0]/60:.1f}-{interval[1]/60:.1f} minutes"
+    return describe_duration(interval)
+
+# ─── Routine Engine ───────────────────────────────────────────────────────────
+class Routine:
+    """A looping sequence of click/keybind steps with breaks, stats and hotkeys.
+
+    Each step is a dict in the same shape the standalone scripts used:
+    ``name``, ``emoji``, ``duration`` (min, max wait after the action) and
+    either ``region_key`` (click a calibrated region) or ``keybinds``
+    (list of keys, e.g. ``['CTRL+3']``). Optional keys:
+
+    - ``stat``: metrics counter to bump (derived from the name otherwise)
+    - ``every``: only run on cycles divisible by this number
+    - ``interval``: (min, max) seconds; run on the first cycle, then only
+      once that much time has passed since it last ran
+    - ``enabled``: set False to skip the step entirely
+    - ``until``: an ``rs3core.sensing`` condition that ends the ``duration``
+      wait early once it is seen on screen; ``duration`` stays the timeout
+
+    ``cycle_until`` is a condition that ends the ``cycle_duration`` wait at
+    the end of each cycle early, e.g. once a processing window closes.
+
+    ``periodic_keybinds`` are pressed on their own (min, max) ``interval``
+    by the routine's scheduler, between the loop's own actions.
+
+    ``backend`` is an input backend name or instance (platform default when
+    omitted). ``regions`` pins fixed region coordinates instead of loading
+    them from the calibration database under ``region_file``'s name
+    (importing that file the first time). Stored regions are relative to
+    the game window titled ``window_title``, so moving or resizing it needs
+    no recalibration. ``calibrations`` is the ``CalibrationDB`` (or its
+    path) and ``profile`` picks one of several calibrations kept for the
+    same routine. Session metrics are exported to ``metrics_file`` (or
+    ``RS3CORE_METRICS``) with every stats report: Prometheus text, or a row
+    appended per report when the name ends in ``.csv``. Every action, wait
+    and break is also appended to a binary session journal in ``journal``
+    (a directory; ``RS3CORE_JOURNAL`` or ``~/.rs3core/journal`` by default,
+    False for none) for ``python -m rs3core.journal`` to analyse later.
+    ``profile_cycles`` (or ``RS3CORE_PROFILE_CYCLES``) samples the loop's
+    stacks for that many cycles from the start of each run, as the
+    profiler hotkey does on demand, into a collapsed-stack file under
+    ``profile_dir``.
+    ``capture`` is a screen capture name or
+    instance for ``until`` conditions. ``clock`` supplies time and sleeps, so a
+    simulated clock can run the loop faster than real time.
+
+    Constructing a routine does no I/O and imports nothing heavy, so a
+    script can be imported (or listed) instantly: the backend, capture,
+    movement and calibration database are set up on first use, normally
+    by ``main``.
+    """
+
+    def __init__(self, name, steps, region_file, emoji='🎮', cycle_name='Cycle',
+                 order='sequential', cycle_duration=None,
+                 break_every=8, break_duration=(12, 30), auto_breaks=True,
+                 stats_every=3, initial_delay=10,
+                 show_detailed_progress=False, progress_update_interval=120,
+                 force_gc=True, movement=None, periodic_keybinds=None,
+                 backend=None, regions=None, clock=None, hotkeys=None, capture=None, cycle_until=None,
+                 window_title=GAME_WINDOW_TITLE, calibrations=None, profile=None,
+                 metrics_file=None, journal=None, profile_cycles=None, profile_dir=None):
+        self.name = name
+        self.steps = steps
+        self.region_file = region_file
+        self.emoji = emoji
+        self.cycle_name = cycle_name
+        self.order = order
+        self.cycle_duration = cycle_duration
+        self.cycle_until = cycle_until
+        self.break_every = break_every
+        self.break_duration = break_duration
+        self.auto_breaks = auto_breaks
+        self.stats_every = stats_every
+        self.initial_delay = initial_delay
+        self.show_detailed_progress = show_detailed_progress
+        self.progress_update_interval = progress_update_interval
+        self.force_gc = force_gc
+        self.periodic_keybinds = periodic_keybinds or []
+
+        self.stop_event = threading.Event()
+        self.stop_event.set()
+        self.wake_event = threading.Event()
+        self.cycle_count = 0
+        self.fixed_regions = regions
+        self.regions = None
+        self.threads = []
+        self.clock = clock or SYSTEM_CLOCK
+        self.backend_spec = backend
+        self.capture_spec = capture
+        self.movement = movement
+        self.window_title = window_title
+        self.calibrations = calibrations
+        self.profile = profile
+        self.scheduler = Scheduler(self.clock)
+        self.hotkeys = hotkeys
+        self.due_steps = set()
+        self.metrics_file = metrics_file or os.environ.get('RS3CORE_METRICS')
+        self.journal_dir = session_journal.journal_dir() if journal is None else journal
+        self.profile_cycles = profile_cycles or int(os.environ.get('RS3CORE_PROFILE_CYCLES', 0))
+        self.profile_dir = profile_dir or os.environ.get('RS3CORE_PROFILES', DEFAULT_PROFILE_DIR)
+        self.profiler = None
+        self.profile_until = None
+        self.profiler_lock = threading.Lock()
+        self.metrics = self._new_metrics()
+
+    # ─── Lazy Setup ───────────────────────────────────────────────────────────
+    # Each of these is built on first access; assigning one (as the
+    # simulator does) replaces it before it is ever built.
+    @cached_property
+    def backend(self):
+        return get_backend(self.backend_spec)
+
+    @cached_property
+    def capture(self):
+        return CachedCapture(get_capture(self.capture_spec))
+
+    @cached_property
+    def region_store(self):
+        calibrations = self.calibrations
+        if not isinstance(calibrations, CalibrationDB):
+            calibrations = CalibrationDB(calibrations)
+        return RegionStore(self.region_file, self.backend, self.window_title, calibrations, self.profile)
+
+    @cached_property
+    def mover(self):
+        from .motion import Mover
+        return Mover(self.backend, self.movement, is_running=lambda: self.running,
+                     on_move=self._count_move, clock=self.clock, bounds=self.region_store.bounds)
+
+    @cached_property
+    def journal(self):
+        if not self.journal_dir:
+            return None
+        try:
+            return session_journal.Journal.for_session(self.journal_dir, self.name, self.steps)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not open a session journal in {self.journal_dir}: {e}")
+            return None
+
+    @cached_property
+    def references(self):
+        # Read once: the locator caches each reference's pyramids for as long as it is the same array
+        return self.region_store.load_references()
+
+    @cached_property
+    def locator(self):
+        from .locate import TemplateLocator
+        return TemplateLocator()
+
+    @cached_property
+    def pipeline(self):
+        from .pipeline import SensingPipeline
+        return SensingPipeline(self.capture, clock=lambda: self.clock.time())
+
+    # ─── State ────────────────────────────────────────────────────────────────
+    @property
+    def running(self):
+        return not self.stop_event.is_set()
+
+    @running.setter
+    def running(self, value):
+        if value:
+            self.stop_event.clear()
+        else:
+            self.stop_event.set()
+            self.wake_event.set()  # also cut short a wait watching the screen
+
+    def set_clock(self, clock):
+        self.clock = self.mover.clock = self.scheduler.clock = clock
+
+    def wait(self, seconds):
+        """Sleep up to ``seconds`` while running due scheduled jobs; returns True the moment the routine is stopped"""
+        return self.scheduler.run_until(self.clock.time() + seconds, self.stop_event)
+
+    def _new_metrics(self):
+        """A fresh registry, with every step's counter resolved up front so bumping one is an attribute increment"""
+        metrics = MetricsRegistry(labels={'routine': self.name})
+        self.step_counters = {}
+        for step in list(self.steps) + list(self.periodic_keybinds):
+            kind = 'clicks' if step.get('region_key') else 'key presses'
+            self.step_counters[id(step)] = metrics.counter(stat_key(step), f"{step['name']} {kind}")
+        self.cycles = metrics.counter('total_cycles', f"{self.cycle_name}s completed")
+        self.moves = metrics.counter('total_moves', "Cursor moves")
+        self.breaks = metrics.counter('total_breaks', "Breaks taken")
+        self.sensed = metrics.counter('total_sensed', "Waits ended early by a screen condition")
+        self.sensing_saved = metrics.counter('sensing_saved_sec', "Seconds of waiting saved by screen conditions")
+        self.step_timings = {id(step): StepTimings(metrics, step, index) for index, step in enumerate(self.steps)}
+        cycle = self.cycle_name.lower()
+        self.cycle_time = metrics.histogram('cycle_seconds', f"Time per {cycle}, waits included")
+        self.cycle_moving = metrics.histogram('cycle_move_seconds', f"Cursor moves per {cycle}")
+        self.cycle_acting = metrics.histogram('cycle_act_seconds', f"Clicks and key presses per {cycle}")
+        self.cycle_waiting = metrics.histogram('cycle_wait_seconds', f"Waiting per {cycle}")
+        self.cycle_other = metrics.histogram('cycle_other_seconds', f"Time per {cycle} outside moves, actions and waits")
+        self.break_time = metrics.histogram('break_seconds', "Break lengths")
+        self.cycle_parts = [0.0, 0.0, 0.0]
+        self.session_start = metrics.gauge('session_start_time', "Unix time the session started")
+        return metrics
+
+    def _count_move(self):
+        self.moves.inc()
+
+    def _journal(self, kind, **fields):
+        if self.journal is not None:
+            self.journal.record(self.clock.time(), kind, cycle=self.cycle_count + 1, **fields)
+
+    def load_regions(self, calibrate_missing=True):
+        if self.fixed_regions is not None:
+            self.regions = dict(self.fixed_regions)
+            return self.regions
+        regions = self.region_store.load()
+        if regions is None and calibrate_missing:
+            logger.warning("No region calibration found. Please calibrate (press 'c').")
+            regions = self.calibrate()
+        self.regions = regions
+        return regions
+
+    def refresh_regions(self):
+        """Follow the game window if it moved; a no-op dict lookup while it stays put"""
+        if self.fixed_regions is None and self.region_store.data is not None:
+            self.regions = self.region_store.current()
+        return self.regions
+
+    def calibrate(self, only=None):
+        self.regions = calibrate_all_regions(self.backend, self.calibration_steps(), self.region_store,
+                                             f"{self.name} Calibration Mode", only=only, keys=self.hotkeys)
+        if self.regions:
+            self.capture_references(only)
+        return self.regions
+
+    def capture_references(self, only=None):
+        """Snapshot each calibrated region as the reference auto-locate searches for later"""
+        references = {}
+        for key, region in self.regions.items():
+            if only is not None and key not in only:
+                continue
+            frame = self.capture.grab(region)
+            if frame is not None:
+                references[key] = frame.copy()
+        if references:
+            self.region_store.save_references(references)
+            if 'references' in self.__dict__:
+                self.references.update(references)
+            logger.info(f"📸 Saved {len(references)} reference snapshot(s) for auto-locate")
+        return references
+
+    def calibration_steps(self):
+        """The steps plus a stand-in for ``cycle_until``, so every watched region gets calibrated"""
+        if self.cycle_until is None:
+            return list(self.steps)
+        return list(self.steps) + [{'name': f"{self.cycle_name} Completion", 'until': self.cycle_until}]
+
+    def missing_regions(self):
+        return [step['name'] for step in region_steps(self.calibration_steps())
+                if step.get('enabled', True) and step['region_key'] not in (self.regions or {})]
+
+    def steps_for_cycle(self, cycle):
+        active = [step for step in self.steps
+                  if step.get('enabled', True) and cycle % step.get('every', 1) == 0
+                  and ('interval' not in step or id(step) in self.due_steps)]
+        if self.order == 'random' and active:
+            return [random.choice(active)]
+        return active
+
+    # ─── Actions ──────────────────────────────────────────────────────────────
+    def _time_part(self, histogram, part, started):
+        """Record the time since ``started`` in ``histogram`` and the running cycle's total for ``part``"""
+        now = self.clock.time()
+        histogram.observe(now - started)
+        self.cycle_parts[part] += now - started
+        return now
+
+    def execute_step(self, step):
+        counter = self.step_counters[id(step)]
+        timings = self.step_timings[id(step)]
+        started = self.clock.time()
+
+        if step.get('keybinds'):
+            logger.info(f"{step['emoji']} Executing {step['name']}...")
+            for i, keybind in enumerate(step['keybinds']):
+                self.backend.press_key(keybind)
+                if i < len(step['keybinds']) - 1:
+                    self.clock.sleep(random.uniform(0.2, 0.5))
+            self._time_part(timings.act, ACTING, started)
+            self._journal(session_journal.KEYS, step=timings.number, actual=self.clock.time() - started)
+            counter.inc()
+            logger.info(f"✅ {step['name']} #{counter.value} completed - pressed {', '.join(step['keybinds'])}")
+            return True
+
+        region_key = step['region_key']
+        if region_key not in self.regions:
+            logger.error(f"❌ Region not found for {step['name']}! Please calibrate.")
+            self._journal(session_journal.CLICK, step=timings.number, outcome=session_journal.FAILED)
+            return False
+
+        logger.info(f"{step['emoji']} Clicking {step['name']}...")
+        if not self.mover.move_into(tuple(self.regions[region_key])):
+            self._journal(session_journal.CLICK, step=timings.number, move=self.clock.time() - started,
+                          outcome=session_journal.STOPPED)
+            return False
+        moved = self._time_part(timings.move, MOVING, started)
+        position = self.mover.settle_and_click()
+        clicked = self._time_part(timings.act, ACTING, moved)
+        self._journal(session_journal.CLICK, step=timings.number, position=position,
+                      move=moved - started, actual=clicked - moved)
+
+        counter.inc()
+        logger.info(f"✅ {step['name']} click #{counter.value} completed at {position}")
+        return True
+
+    def smart_wait(self, wait_time, action_description="next action"):
+        """Wait until an exact deadline, cancelled immediately by a stop request"""
+        end_time = self.clock.time() + wait_time
+        if wait_time <= 30:
+            self.wait(wait_time)
+            return
+
+        logger.info(f"⏰ Waiting {wait_time:.1f}s until {action_description}...")
+
+        while True:
+            remaining = end_time - self.clock.time()
+            if remaining <= 0:
+                return
+            # Wake only to log progress; otherwise sleep straight through to the deadline
+            if self.show_detailed_progress and remaining > 60 + self.progress_update_interval:
+                if self.wait(self.progress_update_interval):
+                    return
+                logger.info(f"⏳ {int((end_time - self.clock.time()) // 60)}m remaining until {action_description}...")
+            elif self.wait(remaining):
+                return
+
+    def condition_region(self, condition, region_key=None):
+        region = region_key if condition.region is None else condition.region
+        if isinstance(region, str):
+            return (self.regions or {}).get(region)
+        return region
+
+    def grab_frames(self, regions):
+        """One frame per region, all from the same tick; None if any of them cannot be read"""
+        if not all(regions):
+            return None
+        self.capture.prefetch(regions)
+        frames = [self.capture.grab(region) for region in regions]
+        return None if any(frame is None for frame in frames) else frames
+
+    def sense_wait(self, condition, timeout, action_description="next action", region_key=None):
+        """Wait for ``condition``, at most ``timeout`` seconds.
+
+        Only the condition's regions (``region_key`` when it names none) are
+        captured, once per ``poll``, with overlapping ones sharing a grab.
+        With no region or no screen to read it degrades to ``smart_wait``.
+        Returns True when the condition ended the wait.
+        """
+        regions = [self.condition_region(leaf, region_key) for leaf in condition.leaves()]
+        frames = self.grab_frames(regions)
+        if frames is None:
+            self.smart_wait(timeout, action_description)
+            return False
+
+        start = self.clock.time()
+        end_time = start + timeout
+        condition.arm_frames(iter(frames), start)
+        if timeout > 30:
+            logger.info(f"⏰ Watching for up to {timeout:.1f}s until {action_description}...")
+        # Real time: capture and tests run on the pipeline threads while this one only waits.
+        # Virtual time jumps past any background work, so there it polls inline.
+        if self.clock.realtime:
+            fired = self._watch_until(condition, regions, end_time)
+        else:
+            fired = self._poll_until(condition, regions, end_time)
+        if fired:
+            saved = end_time - self.clock.time()
+            self.sensed.inc()
+            self.sensing_saved.inc(max(0.0, saved))
+            logger.info(f"👁️  {condition.describe()} after {self.clock.time() - start:.1f}s "
+                        f"({saved:.1f}s early) -> {action_description}")
+        return fired
+
+    def _watch_until(self, condition, regions, end_time):
+        self.wake_event.clear()
+        if not self.running:
+            return False
+        self.pipeline.capture = self.capture
+        self.pipeline.watch(condition, regions, self.wake_event.set)
+        try:
+            woke = self.scheduler.run_until(end_time, self.wake_event)
+        finally:
+            self.pipeline.cancel()
+        return woke and self.running
+
+    def _poll_until(self, condition, regions, end_time):
+        while True:
+            remaining = end_time - self.clock.time()
+            if remaining <= 0:
+                return False
+            if self.wait(min(condition.poll, remaining)):
+                return False
+            frames = self.grab_frames(regions)
+            if frames is not None and condition.test_frames(iter(frames), self.clock.time()):
+                return True
+
+    # ─── Main Loop ────────────────────────────────────────────────────────────
+    def run_cycle(self):
+        cycle_start_time = self.clock.time()
+        plan = self.steps_for_cycle(self.cycle_count)
+        self.refresh_regions()
+        self.cycle_parts = [0.0, 0.0, 0.0]
+
+        for index, step in enumerate(plan):
+            if not self.running or not self.execute_step(step):
+                return False
+            if 'interval' in step:
+                self._schedule_step(step)
+
+            if index + 1 < len(plan):
+                next_step_name = plan[index + 1]['name']
+            else:
+                next_step_name = f"{self.cycle_name.lower()} completion"
+
+            duration = step.get('duration')
+            if duration:
+                timings = self.step_timings[id(step)]
+                planned = random.uniform(*duration)
+                timings.wait_planned.observe(planned)
+                started = self.clock.time()
+                sensed = False
+                if step.get('until'):
+                    sensed = self.sense_wait(step['until'], planned, f"completing {step['name']} -> {next_step_name}",
+                                             step.get('region_key'))
+                else:
+                    self.smart_wait(planned, f"completing {step['name']} -> {next_step_name}")
+                waited = self._time_part(timings.wait, WAITING, started)
+                self._journal(session_journal.WAIT, step=timings.number, planned=planned, actual=waited - started,
+                              outcome=self._wait_outcome(sensed))
+
+        cycle_duration = 0.0
+        if self.cycle_duration and self.running:
+            cycle_duration = random.uniform(*self.cycle_duration)
+            remaining_wait = cycle_duration - (self.clock.time() - cycle_start_time)
+            started = self.clock.time()
+            sensed = False
+            if remaining_wait > 0 and self.cycle_until is not None:
+                sensed = self.sense_wait(self.cycle_until, remaining_wait,
+                                         f"next {self.cycle_name.lower()} (#{self.cycle_count + 2})")
+            elif remaining_wait > 0:
+                self.smart_wait(remaining_wait, f"next {self.cycle_name.lower()} (#{self.cycle_count + 2})")
+            self.cycle_parts[WAITING] += self.clock.time() - started
+            if remaining_wait > 0:
+                self._journal(session_journal.WAIT, planned=remaining_wait, actual=self.clock.time() - started,
+                              outcome=self._wait_outcome(sensed))
+
+        if self.running:
+            moving, acting, waiting = self.cycle_parts
+            total = self.clock.time() - cycle_start_time
+            self.cycle_time.observe(total)
+            self.cycle_moving.observe(moving)
+            self.cycle_acting.observe(acting)
+            self.cycle_waiting.observe(waiting)
+            self.cycle_other.observe(max(0.0, total - moving - acting - waiting))
+            self._journal(session_journal.CYCLE, planned=cycle_duration, actual=total)
+        return self.running
+
+    def _wait_outcome(self, sensed):
+        if sensed:
+            return session_journal.SENSED
+        return session_journal.OK if self.running else session_journal.STOPPED
+
+    def take_break(self):
+        break_duration = random.uniform(*self.break_duration)
+        self.breaks.inc()
+        logger.info(f"☕ Taking break #{self.breaks.value} for {break_duration:.1f}s after {self.cycle_count} {self.cycle_name.lower()}s...")
+        started = self.clock.time()
+        self.smart_wait(break_duration, "break completion")
+        self.break_time.observe(self.clock.time() - started)
+        self._journal(session_journal.BREAK, planned=break_duration, actual=self.clock.time() - started,
+                      outcome=self._wait_outcome(False))
+        if self.running:
+            logger.info(f"🔄 Break finished, resuming {self.name}...")
+
+    def loop(self):
+        logger.info(f"{self.emoji} Starting {self.name}. Press '{START_STOP_KEY}' to stop, '{EXIT_KEY}' to exit.")
+
+        logger.info(f"⏳ Initial delay: {self.initial_delay} seconds to switch screens...")
+        for i in range(self.initial_delay, 0, -1):
+            if not self.running:
+                logger.info("⏹️  Startup cancelled.")
+                return
+            logger.info(f"⏳ Starting in {i} seconds...")
+            self.wait(1)
+
+        logger.info(f"{self.emoji} Starting {self.name} NOW!")
+        self.cycle_count = 0
+        self.start_schedule()
+        self._journal(session_journal.SESSION_START)
+        if self.profile_cycles:
+            self.start_profiler(threading.get_ident(), self.profile_cycles)
+
+        while self.running:
+            try:
+                if not self.run_cycle():
+                    break
+
+                self.cycle_count += 1
+                self.cycles.inc()
+                logger.info(f"🔄 ======================================== {self.cycle_name} #{self.cycle_count} completed!")
+                if self.profile_until is not None and self.cycle_count >= self.profile_until:
+                    self.stop_profiler()
+
+                if self.stats_every and self.cycle_count % self.stats_every == 0:
+                    self.print_stats()
+                    if self.force_gc:
+                        gc.collect()
+
+                if self.break_every and self.cycle_count % self.break_every == 0:
+                    if self.auto_breaks:
+                        self.take_break()
+                    else:
+                        logger.info(f"☕ Auto-break skipped after {self.cycle_count} {self.cycle_name.lower()}s (breaks disabled)")
+
+            except Exception as e:
+                logger.error(f"❌ Error in {self.name} loop: {e}")
+                break
+
+        self._journal(session_journal.SESSION_STOP)
+        self.stop_profiler()
+        logger.info(f"⏸️  {self.name} loop stopped.")
+
+    def _schedule_step(self, step):
+        """Hold an ``interval`` step back until its next due time"""
+        self.due_steps.discard(id(step))
+        self.scheduler.call_later(random.uniform(*step['interval']),
+                                  lambda: self.due_steps.add(id(step)), step['name'])
+
+    def press_periodic_keybind(self, periodic):
+        counter = self.step_counters[id(periodic)]
+        logger.info(f"{periodic.get('emoji', '⌨️')} Executing periodic keybind: '{periodic['keybind']}'")
+        started = self.clock.time()
+        pressed = self.backend.press_key(periodic['keybind'])
+        self._journal(session_journal.PERIODIC, actual=self.clock.time() - started,
+                      outcome=session_journal.OK if pressed else session_journal.FAILED)
+        if pressed:
+            counter.inc()
+            logger.info(f"✅ Keybind #{counter.value} completed")
+            return None
+        logger.warning("⚠️ Keybind failed, will retry in 30s")
+        return 30
+
+    def start_schedule(self):
+        """Reset the scheduler for a new run: interval steps are due at once, periodic keybinds after one interval"""
+        self.scheduler.clear()
+        self.due_steps = {id(step) for step in self.steps if 'interval' in step}
+        for periodic in self.periodic_keybinds:
+            logger.info(f"⌨️ Scheduling '{periodic['keybind']}' every {describe_interval(periodic['interval'])}")
+            self.scheduler.every(periodic['interval'], lambda periodic=periodic: self.press_periodic_keybind(periodic),
+                                 periodic['name'])
+
+    # ─── Profiling ────────────────────────────────────────────────────────────
+    def start_profiler(self, thread_id, cycles=None):
+        """Sample ``thread_id``'s stacks until ``stop_profiler``, or for ``cycles`` more cycles"""
+        with self.profiler_lock:
+            if self.profiler is not None:
+                return
+            self.profiler = SamplingProfiler(thread_id).start()
+            self.profile_until = self.cycle_count + cycles if cycles else None
+        until = f" for {cycles} {self.cycle_name.lower()}s" if cycles else f"; press '{PROFILE_KEY}' again to stop"
+        logger.info(f"🔬 Profiling the loop{until}")
+
+    def stop_profiler(self):
+        """Stop sampling and write the collapsed stacks; returns the file written, if any"""
+        with self.profiler_lock:
+            profiler, self.profiler, self.profile_until = self.profiler, None, None
+        if profiler is None:
+            return None
+        profiler.stop()
+        if not profiler.samples:
+            logger.info("🔬 Profiler stopped before taking any samples")
+            return None
+        try:
+            path = profiler.write(profile_path(self.profile_dir, self.name))
+        except OSError as e:
+            logger.warning(f"⚠️ Could not write the profile to {self.profile_dir}: {e}")
+            return None
+        logger.info(f"🔬 {profiler.samples} samples over {format_time(profiler.elapsed)} "
+                    f"({profiler.overhead * 100:.2f}% overhead) -> {path}")
+        for label, fraction in profiler.hottest():
+            logger.info(f"   {fraction * 100:5.1f}%  {label}")
+        return path
+
+    def handle_profiler(self):
+        if self.profiler is not None:
+            self.stop_profiler()
+        elif self.threads and self.threads[0].is_alive():
+            self.start_profiler(self.threads[0].ident)
+        else:
+            logger.info(f"🔬 Nothing to profile; press '{START_STOP_KEY}' to start the routine first")
+
+    # ─── Stats ────────────────────────────────────────────────────────────────
+    def print_stats(self):
+        if not self.session_start.value:
+            return
+
+        elapsed = self.clock.time() - self.session_start.value
+        counted = {}
+        for step in list(self.steps) + list(self.periodic_keybinds):
+            counted.setdefault(self.step_counters[id(step)], step)
+        total_actions = sum(counter.value for counter in counted)
+        actions_per_min = (total_actions / elapsed) * 60 if elapsed > 0 else 0
+        cycles_per_hour = (self.cycles.value / elapsed) * 3600 if elapsed > 0 else 0
+
+        logger.info("=" * 70)
+        logger.info(f"{self.emoji} {self.name.upper()} SESSION STATISTICS")
+        logger.info("=" * 70)
+        for counter, step in counted.items():
+            logger.info(f"{step.get('emoji', '•')} {step.get('label', step['name'])}: {counter.value}")
+        logger.info(f"🔄 Total {self.cycle_name}s: {self.cycles.value}")
+        logger.info(f"📍 Total Moves: {self.moves.value}")
+        logger.info(f"☕ Total Breaks: {self.breaks.value}")
+        logger.info(f"⏱️  Session Time: {format_time(elapsed)}")
+        logger.info(f"⚡ Actions/Min: {actions_per_min:.1f}")
+        logger.info(f"🔄 {self.cycle_name}s/Hour: {cycles_per_hour:.1f}")
+        if self.sensed.value:
+            logger.info(f"👁️  Waits Ended Early: {self.sensed.value} ({format_time(self.sensing_saved.value)} saved)")
+        timing = self.mover.timer.summary()
+        if timing:
+            logger.info(f"🎯 Path Timing: {timing['achieved_sec']:.2f}s achieved / {timing['target_sec']:.2f}s target "
+                        f"({timing['ratio']:.2f}x, worst sample {timing['worst_late_ms']:.1f}ms late)")
+        for line in self.timing_report():
+            logger.info(line)
+        logger.info("=" * 70)
+        self.export_metrics()
+
+    def timing_report(self):
+        """p50/p95/p99 of each step's move, action and wait, and of where each cycle's time went"""
+        if not self.cycle_time.count:
+            return []
+        lines = ["⏱️  Timings p50/p95/p99:"]
+        for index, step in enumerate(self.steps, 1):
+            timings = self.step_timings[id(step)]
+            if not (timings.act.count or timings.wait.count):
+                continue
+            parts = []
+            if timings.move.count:
+                parts.append(f"move {describe_percentiles(timings.move)}")
+            parts.append(f"{'click' if step.get('region_key') else 'keys'} {describe_percentiles(timings.act)}")
+            if timings.wait.count:
+                parts.append(f"wait {describe_percentiles(timings.wait)} (planned {describe_percentiles(timings.wait_planned)})")
+            lines.append(f"   {step['emoji']} {index}. {step['name']}: {' | '.join(parts)}")
+        lines.append(f"   🔄 Per {self.cycle_name.lower()}: {describe_percentiles(self.cycle_time)} = "
+                     f"move {describe_percentiles(self.cycle_moving)} + act {describe_percentiles(self.cycle_acting)} + "
+                     f"wait {describe_percentiles(self.cycle_waiting)} + other {describe_percentiles(self.cycle_other)}")
+        if self.break_time.count:
+            lines.append(f"   ☕ Breaks: {describe_percentiles(self.break_time)}")
+        return lines
+
+    def export_metrics(self):
+        if not self.metrics_file:
+            return
+        try:
+            self.metrics.export(self.metrics_file)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not write metrics to {self.metrics_file}: {e}")
+
+    # ─── Controls ─────────────────────────────────────────────────────────────
+    def _join_threads(self, message):
+        """Wait for the worker threads; any that are still stuck stay tracked so no second loop starts beside them"""
+        for thread in self.threads:
+            if thread.is_alive():
+                logger.info(message)
+                thread.join(timeout=5)
+        self.threads = [thread for thread in self.threads if thread.is_alive()]
+        if self.threads:
+            logger.warning(f"⚠️ {len(self.threads)} worker thread(s) still finishing their current action")
+
+    def handle_start_stop(self):
+        if not self.running:
+            if self.threads:
+                self._join_threads("⏳ Waiting for the previous run to finish...")
+                if self.threads:
+                    logger.warning(f"⚠️ Not starting until the previous run has stopped; press '{START_STOP_KEY}' again shortly")
+                    return
+            self.running = True
+            self.session_start.set(self.clock.time())
+            logger.info("▶️  AUTOMATION STARTED")
+            logger.info(f"🎮 Controls: Press '{START_STOP_KEY}' to stop, '{EXIT_KEY}' to exit")
+            self.threads = [threading.Thread(target=self.loop, daemon=True)]
+            self.threads[0].start()
+        else:
+            self.running = False
+            logger.info("⏸️  AUTOMATION PAUSED")
+            self._join_threads("⏳ Waiting for current action to complete...")
+            self.print_stats()
+            logger.info(f"🎮 Press '{START_STOP_KEY}' to resume, '{EXIT_KEY}' to exit")
+
+    def handle_exit(self):
+        logger.info("🛑 EXIT REQUESTED")
+        self.running = False
+        self._join_threads("⏳ Waiting for automation to stop...")
+        self.print_stats()
+        logger.info("👋 Goodbye!")
+        # Only tear down what was actually set up
+        for name in ('backend', 'pipeline', 'capture'):
+            if name in self.__dict__:
+                self.__dict__[name].close()
+        if 'region_store' in self.__dict__:
+            self.region_store.db.close()
+        if self.__dict__.get('journal') is not None:
+            self.journal.close()
+        sys.exit(0)
+
+    def handle_calibration(self):
+        if self.fixed_regions is not None:
+            logger.info("🎯 Regions are fixed in the script; edit them there to recalibrate")
+            return
+        logger.info("🎯 CALIBRATION MODE - Recalibrating all regions")
+        self.calibrate()
+        missing = self.missing_regions()
+        if missing:
+            logger.warning(f"❌ Still missing calibration for: {', '.join(missing)}")
+        else:
+            logger.info("✅ Calibration complete! All regions ready.")
+
+    def handle_auto_locate(self):
+        """Re-find every region from its reference snapshot instead of recalibrating by hand"""
+        if self.fixed_regions is not None:
+            logger.info("🎯 Regions are fixed in the script; edit them there to move them")
+            return
+        references = self.references
+        if not references or not self.regions:
+            logger.warning(f"⚠️  No reference snapshots yet; press '{CALIBRATION_KEY}' to calibrate once first")
+            return
+        from .locate import auto_locate
+        located, scores, elapsed = auto_locate(self.capture, self.regions, references, self.locator)
+        for key, score in scores.items():
+            if score is None:
+                logger.warning(f"❌ {key}: not found, keeping {tuple(self.regions[key])}")
+            elif tuple(located[key]) != tuple(self.regions[key]):
+                logger.info(f"🎯 {key}: {tuple(self.regions[key])} -> {located[key]} (match {score:.2f})")
+        found = [key for key, score in scores.items() if score is not None]
+        self.regions = self.region_store.save(located, keys=found)
+        logger.info(f"✅ Auto-located {len(found)}/{len(scores)} regions in {elapsed * 1000:.0f}ms")
+
+    def handle_toggle_breaks(self):
+        self.auto_breaks = not self.auto_breaks
+        logger.info(f"☕ Auto Breaks: {'✅ Enabled' if self.auto_breaks else '❌ Disabled'}")
+
+    def hotkey_sources(self):
+        """Backend keys everywhere, plus system-wide start/stop and exit on native Windows"""
+        sources = [backend_keys(self.backend)]
+        if sys.platform == 'win32' and self.backend.name == 'win32':
+            sources.append(win32_global_hotkeys([START_STOP_KEY, EXIT_KEY]))
+        return sources
+
+    def keyboard_monitor(self):
+        """Block on the hotkey queue and dispatch each key; nothing runs while no key is pressed"""
+        logger.info(f"⌨️  Keyboard monitoring started. Press '{START_STOP_KEY}' to start/stop, '{EXIT_KEY}' to exit, "
+                    f"'{CALIBRATION_KEY}' for calibration, '{AUTO_LOCATE_KEY}' to auto-locate regions, "
+                    f"'{TOGGLE_BREAKS_KEY}' to toggle breaks, '{PROFILE_KEY}' to profile")
+        if self.backend.name == 'win32':
+            logger.info(f"💡 Note: '{START_STOP_KEY}' and '{EXIT_KEY}' work from any window; "
+                        f"the other keys need this console focused")
+
+        actions = {
+            START_STOP_KEY: self.handle_start_stop,
+            CALIBRATION_KEY: self.handle_calibration,
+            TOGGLE_BREAKS_KEY: self.handle_toggle_breaks,
+            AUTO_LOCATE_KEY: self.handle_auto_locate,
+            PROFILE_KEY: self.handle_profiler,
+        }
+        last_key, last_time = None, 0.0
+        try:
+            while True:
+                key = self.hotkeys.wait_key()
+                if key is None:
+                    logger.warning("⚠️  No hotkey sources left; exiting")
+                    self.handle_exit()
+                    break
+                if key == EXIT_KEY:
+                    self.handle_exit()
+                    break
+                if key not in actions:
+                    continue
+                # Drop repeats of the same key (auto-repeat, or console and global hook both firing)
+                now = time.monotonic()
+                if key == last_key and now - last_time < 0.3:
+                    continue
+                last_key, last_time = key, now
+                actions[key]()
+
+        except KeyboardInterrupt:
+            logger.info("👋 Script interrupted by user")
+        except Exception as e:
+            logger.error(f"❌ Error in keyboard monitor: {e}")
+
+    # ─── Entry Point ──────────────────────────────────────────────────────────
+    def print_banner(self):
+        logger.info(f"{self.emoji} Enhanced Anti-Bot {self.name} Automation")
+        logger.info("=" * 70)
+        logger.info(f"⌨️  START/STOP: Press '{START_STOP_KEY}' (backtick)")
+        logger.info(f"⌨️  EXIT: Press '{EXIT_KEY}' (tilde)")
+        logger.info(f"🎯 CALIBRATION: Press '{CALIBRATION_KEY}' to recalibrate all regions")
+        logger.info(f"🔍 AUTO-LOCATE: Press '{AUTO_LOCATE_KEY}' to re-find all regions after the camera moves")
+        logger.info(f"☕ TOGGLE BREAKS: Press '{TOGGLE_BREAKS_KEY}' to enable/disable automatic breaks")
+        logger.info(f"🔬 PROFILE: Press '{PROFILE_KEY}' to start/stop sampling the loop into a flamegraph file")
+        logger.info("─" * 70)
+        logger.info(f"🔄 {len(self.steps)}-STEP SEQUENCE ({self.order}):")
+        for i, step in enumerate(self.steps, 1):
+            extras = []
+            if step.get('every', 1) > 1:
+                extras.append(f"every {step['every']} {self.cycle_name.lower()}s")
+            if step.get('interval'):
+                extras.append(f"every {describe_interval(step['interval'])}")
+            if not step.get('enabled', True):
+                extras.append("disabled")
+            extra = f" [{', '.join(extras)}]" if extras else ""
+            duration = describe_duration(step['duration']) if step.get('duration') else "no wait"
+            if step.get('keybinds'):
+                logger.info(f"{step['emoji']} {i}. {step['name']}: Keys [{', '.join(step['keybinds'])}] ({duration}){extra}")
+            elif step['region_key'] in (self.regions or {}):
+                logger.info(f"{step['emoji']} {i}. {step['name']}: {self.regions[step['region_key']]} ({duration}){extra}")
+            else:
+                logger.warning(f"❌ {i}. {step['name']}: NOT CALIBRATED ({duration}){extra}")
+        for periodic in self.periodic_keybinds:
+            logger.info(f"{periodic.get('emoji', '⌨️')} Periodic '{periodic['keybind']}' every "
+                        f"{describe_interval(periodic['interval'])} (scheduled)")
+        logger.info("─" * 70)
+        s = self.mover.settings
+        logger.info("🤖 ANTI-BOT DETECTION FEATURES:")
+        logger.info(f"🏹 Curved Paths: {'✅ Enabled' if s['curved_paths'] else '❌ Disabled'}")
+        logger.info(f"🎯 Overshoot Correction: {'✅ Enabled' if s['overshoot'] else '❌ Disabled'} ({s['overshoot_chance']*100:.0f}% chance)")
+        logger.info(f"⏸️ Hesitation Pauses: {'✅ Enabled' if s['hesitation'] else '❌ Disabled'} ({s['hesitation_chance']*100:.0f}% chance)")
+        logger.info(f"🔧 Micro Corrections: {'✅ Enabled' if s['micro_corrections'] else '❌ Disabled'} ({s['micro_correction_chance']*100:.0f}% chance)")
+        logger.info(f"🌊 Momentum Simulation: {'✅ Enabled' if s['momentum'] else '❌ Disabled'}")
+        logger.info(f"👀 Distraction Moves: {'✅ Enabled' if s['distraction_moves'] else '❌ Disabled'} ({s['distraction_chance']*100:.0f}% chance)")
+        logger.info(f"🎨 Curve Intensity: {s['curve_intensity']*100:.0f}%")
+        logger.info("─" * 70)
+        if self.cycle_duration:
+            logger.info(f"⏰ {self.cycle_name} Duration: {describe_duration(self.cycle_duration)}")
+        if self.break_every:
+            logger.info(f"☕ Break Every: {self.break_every} {self.cycle_name.lower()}s "
+                        f"({self.break_duration[0]}-{self.break_duration[1]}s, {'enabled' if self.auto_breaks else 'disabled'})")
+        logger.info(f"⏳ Initial Delay: {self.initial_delay} seconds")
+        logger.info("=" * 70)
+
+    def start_up(self):
+        """Bring up input, hotkeys and regions; returns milliseconds taken (excluding any calibration)"""
+        started = time.perf_counter()
+        if self.hotkeys is None:
+            self.hotkeys = HotkeyService(self.hotkey_sources())
+        self.hotkeys.start()
+        regions = self.load_regions(calibrate_missing=False)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if elapsed_ms > STARTUP_BUDGET_MS:
+            logger.error(f"❌ Startup took {elapsed_ms:.0f}ms, over the {STARTUP_BUDGET_MS}ms budget; "
+                         f"run 'python -m rs3core.startup <script>' to see which imports cost the most")
+        else:
+            logger.debug(f"⚡ Startup took {elapsed_ms:.0f}ms")
+        if regions is None:
+            logger.warning("No region calibration found. Please calibrate (press 'c').")
+            self.regions = self.calibrate()
+        return elapsed_ms
+
+    def main(self):
+        self.start_up()
+        self.print_banner()
+
+        missing = self.missing_regions()
+        if missing:
+            logger.warning(f"❌ Missing calibration for: {', '.join(missing)}")
+            logger.warning(f"⚠️  Please press '{CALIBRATION_KEY}' to calibrate all regions before starting!")
+        else:
+            logger.info("✅ All regions calibrated and ready!")
+        logger.info(f"💡 Ready! Press '{START_STOP_KEY}' (backtick) to start automation...")
+
+        try:
+            with high_resolution_timer():
+                self.keyboard_monitor()
+        except KeyboardInterrupt:
+            logger.info("👋 Script interrupted by user")
+        except Exception as e:
+            logger.error(f"❌ Fatal error: {e}")
@@ -0,0 +1,107 @@
+import ctypes
+import logging
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# ─── Key Sources ──────────────────────────────────────────────────────────────
+# A source is any iterable that blocks until the next key and yields it as a
+# single lower-case character; it ends (or yields None) when it has no more.
+
+def backend_keys(backend):
+    """Keys from the input backend (console on Windows, global listener with pynput)"""
+    return iter(backend.wait_key, None)
+
+def scripted_keys(script, sleep=time.sleep):
+    """Stand-in source for headless runs: ``script`` is a list of (delay_seconds, key) pairs"""
+    for delay, key in script:
+        sleep(delay)
+        yield key
+
+WM_HOTKEY = 0x0312
+MOD_ALT, MOD_CONTROL, MOD_SHIFT, MOD_NOREPEAT = 0x0001, 0x0002, 0x0004, 0x4000
+
+def win32_global_hotkeys(keys):
+    """System-wide hotkeys via RegisterHotKey; blocks in GetMessage, so there is no polling.
+
+    Registered keys are consumed system-wide, which is why only the
+    start/stop and exit keys are registered this way.
+    """
+    from ctypes import wintypes
+    user32 = ctypes.windll.user32
+    registered = {}
+    for hotkey_id, key in enumerate(keys, 1):
+        scan = user32.VkKeyScanW(ord(key))
+        vk, shift_state = scan & 0xFF, (scan >> 8) & 0xFF
+        modifiers = MOD_NOREPEAT
+        modifiers |= MOD_SHIFT if shift_state & 1 else 0
+        modifiers |= MOD_CONTROL if shift_state & 2 else 0
+        modifiers |= MOD_ALT if shift_state & 4 else 0
+        if user32.RegisterHotKey(None, hotkey_id, modifiers, vk):
+            registered[hotkey_id] = key
+        else:
+            logger.warning(f"⚠️  Could not register global hotkey '{key}' (in use by another program?)")
+
+    msg = wintypes.MSG()
+    try:
+        while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+            if msg.message == WM_HOTKEY and msg.wParam in registered:
+                yield registered[msg.wParam]
+    finally:
+        for hotkey_id in registered:
+            user32.UnregisterHotKey(None, hotkey_id)
+
+# ─── Hotkey Service ───────────────────────────────────────────────────────────
+class HotkeyService:
+    """Funnels keys from every source into one queue.
+
+    Each source runs on its own daemon thread that blocks inside the source,
+    so nothing polls while idle. Consumers block in ``wait_key``; once every
+    source has ended it returns None. ``send`` injects a key directly,
+    which is how tests and headless runs drive a routine.
+    """
+
+    def __init__(self, sources=()):
+        self.keys = queue.Queue()
+        self.sources = list(sources)
+        self.threads = []
+        self._live = 0
+        self._lock = threading.Lock()
+
+    def start(self):
+        self._live = len(self.sources)
+        for source in self.sources:
+            thread = threading.Thread(target=self._pump, args=(source,), daemon=True)
+            self.threads.append(thread)
+            thread.start()
+        if not self.sources:
+            self.keys.put(None)
+        return self
+
+    def _pump(self, source):
+        try:
+            for key in source:
+                if key is None:
+                    break
+                self.keys.put(key)
+        except Exception as e:
+            logger.error(f"❌ Hotkey source stopped: {e}")
+        finally:
+            with self._lock:
+                self._live -= 1
+                if self._live == 0:
+                    self.keys.put(None)
+
+    def send(self, key):
+        self.keys.put(key)
+
+    def wait_key(self, timeout=None):
+        try:
+            key = self.keys.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        if key is None:
+            self.keys.put(None)  # keep reporting the end to later callers
+        return key
@@ -0,0 +1,105 @@
+from .sensing import Condition
+
+INVENTORY_COLUMNS = 4
+INVENTORY_ROWS = 7
+
+# ─── Inventory Grid ───────────────────────────────────────────────────────────
+class InventoryGrid:
+    """The backpack as a ``rows`` x ``columns`` grid over a calibrated rectangle.
+
+    Slots are cut out of one capture with a reshape (no per-slot loop), and
+    ``inset`` trims each slot's border so grid lines and the stack-count
+    text in the corner do not count. A slot is occupied when its grey-level
+    variance is above ``variance_threshold`` (item icons are detailed, an
+    empty slot is flat) or, when ``background`` is given, when its mean
+    colour is more than ``tolerance`` away from it.
+    """
+
+    def __init__(self, columns=INVENTORY_COLUMNS, rows=INVENTORY_ROWS, inset=0.2,
+                 variance_threshold=120.0, background=None, tolerance=25):
+        self.columns = columns
+        self.rows = rows
+        self.inset = inset
+        self.variance_threshold = variance_threshold
+        self.background = background
+        self.tolerance = tolerance
+
+    @property
+    def slots(self):
+        return self.columns * self.rows
+
+    def cells(self, frame):
+        """``(slots, h, w, 3)`` view of each slot's inner area, row by row"""
+        slot_h, slot_w = frame.shape[0] // self.rows, frame.shape[1] // self.columns
+        grid = frame[:slot_h * self.rows, :slot_w * self.columns, :3]
+        grid = grid.reshape(self.rows, slot_h, self.columns, slot_w, 3).swapaxes(1, 2)
+        dy, dx = int(slot_h * self.inset), int(slot_w * self.inset)
+        return grid[:, :, dy:slot_h - dy or None, dx:slot_w - dx or None].reshape(
+            self.slots, slot_h - 2 * dy, slot_w - 2 * dx, 3)
+
+    def slot_stats(self, frame):
+        """Per-slot mean colour ``(slots, 3)`` and grey-level variance ``(slots,)``"""
+        import numpy as np  # on first use, like the sensing helpers, to keep it out of import time
+        cells = self.cells(frame).astype(np.float32)
+        means = cells.mean(axis=(1, 2))
+        variances = cells.mean(axis=-1).var(axis=(1, 2))
+        return means, variances
+
+    def occupancy(self, frame, stats=None):
+        """Boolean ``(slots,)`` array, True where a slot holds an item"""
+        import numpy as np
+        means, variances = stats if stats is not None else self.slot_stats(frame)
+        occupied = variances > self.variance_threshold
+        if self.background is not None:
+            occupied |= np.abs(means - np.asarray(self.background, np.float32)).max(axis=-1) > self.tolerance
+        return occupied
+
+    def count(self, frame):
+        return int(self.occupancy(frame).sum())
+
+    def slot_region(self, region, index):
+        """Screen box of slot ``index`` (0 = top-left, row by row) inside the inventory ``region``"""
+        x1, y1, x2, y2 = region
+        slot_w, slot_h = (x2 - x1) / self.columns, (y2 - y1) / self.rows
+        row, column = divmod(index, self.columns)
+        return (round(x1 + column * slot_w), round(y1 + row * slot_h),
+                round(x1 + (column + 1) * slot_w), round(y1 + (row + 1) * slot_h))
+
+# ─── Inventory Conditions ─────────────────────────────────────────────────────
+class InventoryProcessed(Condition):
+    """True once the items in the inventory have been used up or turned into something else.
+
+    At arm time it notes which slots hold items and what they look like.
+    It fires when no more than ``at_most`` slots are still occupied (logs
+    burnt, potions drunk) or, unless ``emptied`` is set, once every slot
+    that was occupied looks different (uncut gems cut, raw food cooked).
+    """
+
+    def __init__(self, region='INVENTORY_REGION', grid=None, emptied=False, at_most=0,
+                 change_tolerance=20, poll=0.6):
+        super().__init__(region, poll=poll)
+        self.grid = grid or InventoryGrid()
+        self.emptied = emptied
+        self.at_most = at_most
+        self.change_tolerance = change_tolerance
+        self.start_means = None
+        self.start_occupied = None
+
+    def arm(self, frame, now):
+        stats = self.grid.slot_stats(frame)
+        self.start_means = stats[0]
+        self.start_occupied = self.grid.occupancy(frame, stats)
+
+    def test(self, frame, now):
+        import numpy as np
+        stats = self.grid.slot_stats(frame)
+        occupied = self.grid.occupancy(frame, stats)
+        if np.count_nonzero(occupied) <= self.at_most:
+            return True
+        if self.emptied or not self.start_occupied.any():
+            return False
+        changed = np.abs(stats[0] - self.start_means).max(axis=-1) > self.change_tolerance
+        return bool(changed[self.start_occupied].all())
+
+    def describe(self):
+        return "inventory emptied" if self.emptied else "inventory processed"
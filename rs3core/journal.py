@@ -0,0 +1,279 @@
+"""Append-only binary session journal, and an analyzer for piles of them.
+
+    python -m rs3core.journal                         # every journal in ~/.rs3core/journal
+    python -m rs3core.journal sessions/ --stall 3 --by hour
+
+Each session writes one file: a small JSON header (routine, step names,
+host) followed by fixed 32-byte records, one per click, key press, wait,
+break and completed cycle. The file is memory-mapped and grown in chunks,
+and the record count in the header is bumped after every record, so a
+crash loses at most the record being written. The analyzer maps files
+read-only and walks them in slices, so thousands of hours of sessions
+never have to fit in memory at once.
+"""
+
+import datetime
+import json
+import mmap
+import os
+import socket
+import struct
+import sys
+import threading
+import time
+
+MAGIC = b'RS3J'
+VERSION = 1
+# time, kind, outcome, step, cycle, x, y, planned, actual, move
+RECORD = struct.Struct('<dBBHIhhfff')
+PREAMBLE = struct.Struct('<4sHHIQ')   # magic, version, record size, header size, record count
+COUNT_OFFSET = 12
+GROW_RECORDS = 32768                  # 1MB of records per extension
+JOURNAL_EXTENSION = '.rsj'
+DEFAULT_JOURNAL_DIR = os.path.join(os.path.expanduser('~'), '.rs3core', 'journal')
+
+# Record kinds
+SESSION_START, SESSION_STOP, CLICK, KEYS, WAIT, BREAK, CYCLE, PERIODIC = range(1, 9)
+KIND_NAMES = {SESSION_START: 'start', SESSION_STOP: 'stop', CLICK: 'click', KEYS: 'keys', WAIT: 'wait',
+              BREAK: 'break', CYCLE: 'cycle', PERIODIC: 'periodic'}
+# Outcomes
+OK, FAILED, STOPPED, SENSED = range(4)
+
+def journal_dir():
+    """Where sessions are journaled (``RS3CORE_JOURNAL``), or None when it is set to ``off``"""
+    directory = os.environ.get('RS3CORE_JOURNAL', DEFAULT_JOURNAL_DIR)
+    return None if directory.lower() in ('', 'off', 'none') else directory
+
+# ─── Writer ───────────────────────────────────────────────────────────────────
+class Journal:
+    """One session's journal file, written through a memory map.
+
+    ``record`` packs straight into the mapped pages (no write syscall per
+    action); the OS writes them back in the background. ``close`` trims the
+    unused tail of the last chunk.
+    """
+
+    def __init__(self, path, routine, steps):
+        self.path = path
+        self.lock = threading.Lock()
+        meta = json.dumps({'routine': routine, 'steps': [step['name'] for step in steps],
+                           'host': socket.gethostname(), 'pid': os.getpid(), 'started': time.time()}).encode()
+        # Records start on a record boundary after the header
+        self.header_size = -(-(PREAMBLE.size + len(meta)) // RECORD.size) * RECORD.size
+        self.count = 0
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.file = open(path, 'w+b')
+        self.file.write(PREAMBLE.pack(MAGIC, VERSION, RECORD.size, self.header_size, 0) + meta)
+        self.capacity = 0
+        self.map = None
+        self._grow()
+
+    @classmethod
+    def for_session(cls, directory, routine, steps):
+        slug = ''.join(c if c.isalnum() else '-' for c in routine.lower()).strip('-')
+        name = f"{slug}-{datetime.datetime.now():%Y%m%d-%H%M%S}-{os.getpid()}{JOURNAL_EXTENSION}"
+        return cls(os.path.join(directory, name), routine, steps)
+
+    def _grow(self):
+        if self.map is not None:
+            self.map.close()
+        self.capacity += GROW_RECORDS
+        self.file.truncate(self.header_size + self.capacity * RECORD.size)
+        self.map = mmap.mmap(self.file.fileno(), 0)
+
+    def record(self, when, kind, step=0, cycle=0, position=None, planned=0.0, actual=0.0, move=0.0, outcome=OK):
+        x, y = position if position is not None else (0, 0)
+        with self.lock:
+            if self.map is None:
+                return
+            if self.count == self.capacity:
+                self._grow()
+            RECORD.pack_into(self.map, self.header_size + self.count * RECORD.size, when, kind, outcome, step,
+                             cycle, max(-32768, min(32767, int(x))), max(-32768, min(32767, int(y))),
+                             planned, actual, move)
+            self.count += 1
+            struct.pack_into('<Q', self.map, COUNT_OFFSET, self.count)
+
+    def close(self):
+        with self.lock:
+            if self.map is None:
+                return
+            self.map.flush()
+            self.map.close()
+            self.map = None
+            self.file.truncate(self.header_size + self.count * RECORD.size)
+            self.file.close()
+
+# ─── Reader ───────────────────────────────────────────────────────────────────
+def record_dtype():
+    import numpy as np
+    return np.dtype([('time', '<f8'), ('kind', 'u1'), ('outcome', 'u1'), ('step', '<u2'), ('cycle', '<u4'),
+                     ('x', '<i2'), ('y', '<i2'), ('planned', '<f4'), ('actual', '<f4'), ('move', '<f4')])
+
+def read_journal(path, chunk=1 << 20):
+    """``(meta, slices)``: the header dict and a generator of structured-array views, ``chunk`` records at a time"""
+    import numpy as np
+    with open(path, 'rb') as f:
+        magic, version, record_size, header_size, count = PREAMBLE.unpack(f.read(PREAMBLE.size))
+        if magic != MAGIC or record_size != RECORD.size:
+            raise ValueError(f"{path} is not a version {VERSION} rs3core journal")
+        meta = json.loads(f.read(header_size - PREAMBLE.size).rstrip(b'\0').decode())
+
+    def slices():
+        if not count:
+            return
+        # Pages are read in as each slice is touched and dropped once the map is garbage
+        records = np.memmap(path, record_dtype(), 'r', header_size, (count,))
+        for start in range(0, count, chunk):
+            yield records[start:start + chunk]
+    return meta, slices()
+
+def find_journals(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                if name.endswith(JOURNAL_EXTENSION):
+                    yield os.path.join(path, name)
+        elif os.path.isfile(path):
+            yield path
+
+# ─── Analyzer ─────────────────────────────────────────────────────────────────
+class SessionSummary:
+    """Running totals for one journal, built slice by slice"""
+
+    def __init__(self, path, meta):
+        self.path = path
+        self.meta = meta
+        self.first = None
+        self.last = None
+        self.active = 0.0
+        self.counts = {kind: 0 for kind in KIND_NAMES}
+        self.failed = 0
+        self.sensed = 0
+        self.stalls = []
+        self.previous_kind = SESSION_STOP
+        self.previous_time = None
+        self.running_since = None
+
+    def add(self, records, stall_sec, buckets, bucket_sec):
+        import numpy as np
+        if not len(records):
+            return
+        times = records['time']
+        kinds = records['kind']
+        if self.first is None:
+            self.first = float(times[0])
+        for kind in KIND_NAMES:
+            self.counts[kind] += int(np.count_nonzero(kinds == kind))
+        self.failed += int(np.count_nonzero(records['outcome'] == FAILED))
+        self.sensed += int(np.count_nonzero(records['outcome'] == SENSED))
+
+        self._find_stalls(records[kinds != PERIODIC], stall_sec)
+
+        # Active time runs from each start to its stop; there are only a handful of those per file
+        toggles = (kinds == SESSION_START) | (kinds == SESSION_STOP)
+        for when, kind in zip(times[toggles].tolist(), kinds[toggles].tolist()):
+            if kind == SESSION_START:
+                self.running_since = when
+            elif self.running_since is not None:
+                self.active += when - self.running_since
+                self.running_since = None
+
+        cycles = times[kinds == CYCLE]
+        for key, count in zip(*np.unique((cycles // bucket_sec).astype(np.int64), return_counts=True)):
+            buckets[int(key)] = buckets.get(int(key), 0) + int(count)
+        self.last = float(times[-1])
+
+    def _find_stalls(self, records, stall_sec):
+        """Stalls: time since the previous record that this one does not account for (idle between sessions aside).
+
+        A cycle record's duration spans the records before it, so it accounts
+        for nothing itself. Periodic keybinds are pressed in the middle of a
+        wait, whose record already covers them, so they are left out.
+        """
+        import numpy as np
+        if not len(records):
+            return
+        times = records['time']
+        kinds = records['kind']
+        previous = np.concatenate(([self.previous_time if self.previous_time is not None else times[0]], times[:-1]))
+        gaps = times - previous - np.where(kinds == CYCLE, 0.0, records['actual'] + records['move'])
+        idle = np.concatenate(([self.previous_kind == SESSION_STOP], kinds[:-1] == SESSION_STOP)) | (kinds == SESSION_START)
+        for index in np.flatnonzero((gaps > stall_sec) & ~idle):
+            self.stalls.append((float(times[index]), float(gaps[index]), int(kinds[index]), int(records['step'][index])))
+        self.previous_time = float(times[-1])
+        self.previous_kind = int(kinds[-1])
+
+    def finish(self):
+        # A session that crashed or was killed has no stop record: count it as running to its last record
+        if self.running_since is not None:
+            self.active += self.last - self.running_since
+            self.running_since = None
+
+def analyze(paths, stall_sec=5.0, bucket='day', chunk=1 << 20):
+    """Summaries per session plus cycles per ``bucket`` ('hour' or 'day') across all of them"""
+    bucket_sec = 3600 if bucket == 'hour' else 86400
+    buckets = {}
+    sessions = []
+    for path in find_journals(paths):
+        meta, slices = read_journal(path, chunk)
+        summary = SessionSummary(path, meta)
+        for records in slices:
+            summary.add(records, stall_sec, buckets, bucket_sec)
+        summary.finish()
+        sessions.append(summary)
+    return sessions, {key * bucket_sec: count for key, count in sorted(buckets.items())}
+
+def print_analysis(sessions, trend, bucket, stall_sec, top=10):
+    total_active = sum(session.active for session in sessions)
+    total_cycles = sum(session.counts[CYCLE] for session in sessions)
+    total_actions = sum(session.counts[CLICK] + session.counts[KEYS] + session.counts[PERIODIC] for session in sessions)
+    print(f"{'routine':<28} {'started':<17} {'active':>8} {'cycles':>7} {'cyc/h':>7} {'act/h':>7} {'failed':>6} {'stalls':>6}")
+    for session in sessions:
+        if session.first is None:
+            continue
+        hours = session.active / 3600
+        actions = session.counts[CLICK] + session.counts[KEYS] + session.counts[PERIODIC]
+        started = datetime.datetime.fromtimestamp(session.first).strftime('%Y-%m-%d %H:%M')
+        print(f"{session.meta.get('routine', '?')[:28]:<28} {started:<17} {hours:7.1f}h {session.counts[CYCLE]:7d} "
+              f"{session.counts[CYCLE] / hours if hours else 0:7.1f} {actions / hours if hours else 0:7.0f} "
+              f"{session.failed:6d} {len(session.stalls):6d}")
+    hours = total_active / 3600
+    print(f"\n{len(sessions)} sessions, {hours:.1f}h active, {total_cycles} cycles "
+          f"({total_cycles / hours if hours else 0:.1f}/h), {total_actions} actions "
+          f"({total_actions / hours if hours else 0:.0f}/h)")
+
+    stalls = sorted(((gap, when, kind, step, session) for session in sessions
+                     for when, gap, kind, step in session.stalls), key=lambda stall: stall[0], reverse=True)
+    if stalls:
+        print(f"\nLongest stalls (unaccounted time over {stall_sec:.1f}s):")
+        for gap, when, kind, step, session in stalls[:top]:
+            steps = session.meta.get('steps', [])
+            name = f"{KIND_NAMES[kind]} {steps[step - 1]}" if 0 < step <= len(steps) else KIND_NAMES.get(kind, '?')
+            print(f"  {gap:8.1f}s  {datetime.datetime.fromtimestamp(when):%Y-%m-%d %H:%M:%S}  "
+                  f"{session.meta.get('routine', '?')}, before {name}")
+
+    if trend:
+        print(f"\nCycles per {bucket}:")
+        for start, count in trend.items():
+            fmt = '%Y-%m-%d %H:00' if bucket == 'hour' else '%Y-%m-%d'
+            print(f"  {datetime.datetime.fromtimestamp(start).strftime(fmt)}  {count:7d}")
+
+def main(argv=None):
+    import argparse  # only the CLI needs it; the engine imports this module for the writer
+    parser = argparse.ArgumentParser(description="Summarise rs3core session journals")
+    parser.add_argument('paths', nargs='*', help="journal files or directories (default: the journal directory)")
+    parser.add_argument('--stall', type=float, default=5.0, help="seconds of unaccounted time that count as a stall")
+    parser.add_argument('--by', choices=('hour', 'day'), default='day', help="trend bucket")
+    args = parser.parse_args(argv)
+
+    paths = args.paths or [journal_dir() or DEFAULT_JOURNAL_DIR]
+    sessions, trend = analyze(paths, args.stall, args.by)
+    if not sessions:
+        print(f"No journals found in {', '.join(paths)}")
+        return 1
+    print_analysis(sessions, trend, args.by, args.stall)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+import logging
+import time
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+logger = logging.getLogger(__name__)
+
+MIN_TEMPLATE_SIDE = 6
+
+# ─── Image Helpers ────────────────────────────────────────────────────────────
+def to_gray(frame):
+    """RGB uint8 -> float32 luma"""
+    return frame[..., :3].astype(np.float32) @ np.array([0.299, 0.587, 0.114], np.float32)
+
+def downsample(gray):
+    """Halve both sides by averaging 2x2 blocks"""
+    h, w = gray.shape[0] // 2 * 2, gray.shape[1] // 2 * 2
+    g = gray[:h, :w]
+    return (g[0::2, 0::2] + g[1::2, 0::2] + g[0::2, 1::2] + g[1::2, 1::2]) * 0.25
+
+def build_pyramid(gray, levels):
+    """``[full, half, quarter, ...]``, stopping early once a side would drop below MIN_TEMPLATE_SIDE"""
+    pyramid = [gray]
+    while len(pyramid) < levels and min(pyramid[-1].shape) // 2 >= MIN_TEMPLATE_SIDE:
+        pyramid.append(downsample(pyramid[-1]))
+    return pyramid
+
+def resize(gray, scale):
+    """Bilinear resize by ``scale``"""
+    if scale == 1.0:
+        return gray
+    h, w = gray.shape
+    nh, nw = max(1, round(h * scale)), max(1, round(w * scale))
+    ys = np.linspace(0, h - 1, nh, dtype=np.float32)
+    xs = np.linspace(0, w - 1, nw, dtype=np.float32)
+    y0, x0 = ys.astype(int), xs.astype(int)
+    y1, x1 = np.minimum(y0 + 1, h - 1), np.minimum(x0 + 1, w - 1)
+    fy, fx = (ys - y0)[:, None], (xs - x0)[None, :]
+    top = gray[y0][:, x0] * (1 - fx) + gray[y0][:, x1] * fx
+    bottom = gray[y1][:, x0] * (1 - fx) + gray[y1][:, x1] * fx
+    return (top * (1 - fy) + bottom * fy).astype(np.float32)
+
+def match_template(image, template):
+    """Normalised cross-correlation of ``template`` at every valid offset in ``image`` (-1..1)"""
+    th, tw = template.shape
+    if image.shape[0] < th or image.shape[1] < tw:
+        return None
+    t = template - template.mean()
+    t_norm = float(np.sqrt((t * t).sum()))
+    windows = sliding_window_view(image, (th, tw))
+    numerator = np.einsum('ijkl,kl->ij', windows, t, optimize=True)
+    n = th * tw
+    # Window sums via an integral image instead of summing every window again
+    integral = np.pad(image, ((1, 0), (1, 0))).cumsum(0).cumsum(1)
+    squared = np.pad(image * image, ((1, 0), (1, 0))).cumsum(0).cumsum(1)
+    def window_sum(table):
+        return table[th:, tw:] - table[:-th, tw:] - table[th:, :-tw] + table[:-th, :-tw]
+    sums = window_sum(integral)
+    variance = window_sum(squared) - sums * sums / n
+    denominator = np.sqrt(np.maximum(variance, 0)) * t_norm
+    return np.where(denominator > 1e-6, numerator / np.maximum(denominator, 1e-6), 0.0)
+
+# ─── Template Locator ─────────────────────────────────────────────────────────
+class TemplateLocator:
+    """Finds stored reference snippets again after the camera or window moves.
+
+    Each reference is converted to grey, resized to every entry in
+    ``scales`` and turned into an image pyramid once; the result is cached
+    per region key until a different reference is passed in. A search runs
+    NCC over the whole window only at the coarsest level, then refines the
+    best hit by a couple of pixels per level back down to full resolution.
+    """
+
+    def __init__(self, levels=3, scales=(0.9, 1.0, 1.1), min_score=0.75):
+        self.levels = levels
+        self.scales = scales
+        self.min_score = min_score
+        self.cache = {}
+
+    def templates(self, key, reference):
+        cached = self.cache.get(key)
+        if cached is None or cached[0] is not reference:
+            gray = to_gray(reference)
+            pyramids = [(scale, build_pyramid(resize(gray, scale), self.levels)) for scale in self.scales]
+            cached = self.cache[key] = (reference, pyramids)
+        return cached[1]
+
+    def locate(self, key, reference, window):
+        """Best match of ``reference`` inside ``window`` as ``(x, y, width, height, score)`` in window pixels, or None"""
+        image_pyramid = build_pyramid(to_gray(window), self.levels)
+        best = None
+        for scale, template_pyramid in self.templates(key, reference):
+            level = min(len(template_pyramid), len(image_pyramid)) - 1
+            scores = match_template(image_pyramid[level], template_pyramid[level])
+            if scores is None:
+                continue
+            y, x = np.unravel_index(int(np.argmax(scores)), scores.shape)
+            score = float(scores[y, x])
+            for level in range(level - 1, -1, -1):
+                y, x, score = self._refine(image_pyramid[level], template_pyramid[level], 2 * y, 2 * x)
+            th, tw = template_pyramid[0].shape
+            if best is None or score > best[4]:
+                best = (int(x), int(y), tw, th, score)
+        if best is None or best[4] < self.min_score:
+            return None
+        return best
+
+    @staticmethod
+    def _refine(image, template, y, x, radius=2):
+        th, tw = template.shape
+        y0, x0 = max(0, y - radius), max(0, x - radius)
+        patch = image[y0:y + th + radius, x0:x + tw + radius]
+        scores = match_template(patch, template)
+        if scores is None:
+            return y, x, -1.0
+        dy, dx = np.unravel_index(int(np.argmax(scores)), scores.shape)
+        return y0 + dy, x0 + dx, float(scores[dy, dx])
+
+# ─── Auto-Locate ──────────────────────────────────────────────────────────────
+def search_window(region, margin):
+    """The region grown by ``margin`` (pixels, or a fraction of its size when < 1) on every side"""
+    x1, y1, x2, y2 = (int(v) for v in region)
+    mx = int(margin * (x2 - x1)) if margin < 1 else int(margin)
+    my = int(margin * (y2 - y1)) if margin < 1 else int(margin)
+    return (max(0, x1 - mx), max(0, y1 - my), x2 + mx, y2 + my)
+
+def auto_locate(capture, regions, references, locator, margin=120):
+    """Re-find every region that has a reference; returns (updated regions, {key: score or None}, seconds).
+
+    Only a window around each region's last known position is captured and
+    searched. Regions whose reference is not found keep their old box.
+    """
+    start = time.perf_counter()
+    located = dict(regions)
+    scores = {}
+    for key, reference in references.items():
+        if key not in regions:
+            continue
+        window_box = search_window(regions[key], margin)
+        window = capture.grab(window_box)
+        if window is None:
+            scores[key] = None
+            continue
+        match = locator.locate(key, reference, window)
+        if match is None:
+            scores[key] = None
+            continue
+        x, y, width, height, score = match
+        located[key] = (window_box[0] + x, window_box[1] + y, window_box[0] + x + width, window_box[1] + y + height)
+        scores[key] = score
+    return located, scores, time.perf_counter() - start
@@ -0,0 +1,89 @@
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+LOG_FILE_BYTES = 5 * 1024 * 1024
+LOG_FILE_BACKUPS = 3
+
+_listener = None
+
+# ─── Logging Configuration ────────────────────────────────────────────────────
+class ColoredFormatter(logging.Formatter):
+    COLORS = {
+        'DEBUG': '\033[36m',
+        'INFO': '\033[32m',
+        'WARNING': '\033[33m',
+        'ERROR': '\033[31m',
+        'CRITICAL': '\033[35m'
+    }
+    RESET = '\033[0m'
+    def format(self, record):
+        # Color a copy: the same record also goes to the log file, which must stay plain
+        colored = logging.makeLogRecord(record.__dict__)
+        colored.levelname = f"{self.COLORS.get(record.levelname, '')}{record.levelname}{self.RESET}"
+        return super().format(colored)
+
+class RecordQueueHandler(logging.handlers.QueueHandler):
+    """Enqueue records unformatted, so merging args and rendering tracebacks happen on the listener too.
+
+    The stock ``prepare`` formats on the calling thread to make records
+    safe to pickle or to hand to code that mutates its arguments; here the
+    queue stays in-process and log arguments are plain values.
+    """
+
+    def prepare(self, record):
+        # A copy, so nothing the listener does is seen by other handlers holding the same record
+        return logging.makeLogRecord(record.__dict__)
+
+def setup_logging(level=logging.INFO, log_file=None, asynchronous=True):
+    """Attach the colored stdout handler (and a rotating ``log_file``) to the root logger, once.
+
+    With ``asynchronous`` the root logger only gets a ``RecordQueueHandler``:
+    callers enqueue the raw record and return, and a background listener
+    does the formatting, console writes and flushes, so a slow or blocked
+    terminal never holds up cursor playback. The listener is drained at
+    exit. ``log_file`` defaults to ``RS3CORE_LOG_FILE``; it rotates at
+    LOG_FILE_BYTES and keeps LOG_FILE_BACKUPS old files.
+    """
+    global _listener
+    root = logging.getLogger()
+    root.setLevel(level)
+    for existing in root.handlers:
+        if getattr(existing, 'rs3core', False):
+            return root
+
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(ColoredFormatter(LOG_FORMAT))
+    handlers = [console]
+    log_file = log_file or os.environ.get('RS3CORE_LOG_FILE')
+    if log_file:
+        file_handler = logging.handlers.RotatingFileHandler(log_file, maxBytes=LOG_FILE_BYTES,
+                                                            backupCount=LOG_FILE_BACKUPS, encoding='utf-8')
+        file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        handlers.append(file_handler)
+
+    if asynchronous:
+        records = queue.SimpleQueue()
+        _listener = logging.handlers.QueueListener(records, *handlers, respect_handler_level=True)
+        _listener.start()
+        atexit.register(stop_logging)
+        handlers = [RecordQueueHandler(records)]
+    for handler in handlers:
+        handler.rs3core = True
+        root.addHandler(handler)
+    return root
+
+def stop_logging():
+    """Write out anything still queued and stop the background writer"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            if getattr(handler, 'rs3core', False):
+                root.removeHandler(handler)
@@ -0,0 +1,228 @@
+import csv
+import math
+import os
+import socket
+import time
+from array import array
+
+def escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+# ─── Metrics ──────────────────────────────────────────────────────────────────
+class Counter:
+    """A value that only goes up (clicks, cycles, seconds saved)"""
+
+    __slots__ = ('name', 'help', 'value')
+    kind = 'counter'
+
+    def __init__(self, name, help=''):
+        self.name = name
+        self.help = help
+        self.value = 0
+
+    def inc(self, amount=1):
+        self.value += amount
+
+    def samples(self):
+        return [(self.name, self.value)]
+
+class Gauge(Counter):
+    """A value that is set rather than counted (session start, regions calibrated)"""
+
+    __slots__ = ()
+    kind = 'gauge'
+
+    def set(self, value):
+        self.value = value
+
+class Timer:
+    """Count, total and worst of a repeated duration, in seconds"""
+
+    __slots__ = ('name', 'help', 'count', 'sum', 'max')
+    kind = 'summary'
+
+    def __init__(self, name, help=''):
+        self.name = name
+        self.help = help
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds):
+        self.count += 1
+        self.sum += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    @property
+    def value(self):
+        return self.sum / self.count if self.count else 0.0
+
+    def samples(self):
+        return [(f"{self.name}_count", self.count), (f"{self.name}_sum", self.sum), (f"{self.name}_max", self.max)]
+
+class Histogram(Timer):
+    """A ``Timer`` that also buckets every observation on a log scale, for percentiles.
+
+    Bucket ``i`` holds values up to ``low * 2 ** (i / per_octave)``, so
+    relative precision is the same for a 5ms click and a 5-minute wait and
+    the default 1ms..~2h range needs only 369 counters. Observing is one
+    log and one increment; percentiles are interpolated inside the bucket
+    they fall in (each ~4.4% wide with 16 per octave), narrowed to the
+    smallest and largest values seen, so a tight distribution still shows
+    its spread instead of every percentile collapsing onto ``max``.
+    """
+
+    __slots__ = ('low', 'per_octave', 'counts', 'min')
+    kind = 'histogram'
+
+    def __init__(self, name, help='', low=0.001, high=8192.0, per_octave=16):
+        super().__init__(name, help)
+        self.min = math.inf
+        self.low = low
+        self.per_octave = per_octave
+        self.counts = array('L', bytes(array('L').itemsize * (self._index(high) + 1)))
+
+    def _index(self, seconds):
+        if seconds <= self.low:
+            return 0
+        return math.ceil(math.log2(seconds / self.low) * self.per_octave - 1e-9)
+
+    def upper_bound(self, index):
+        return self.low * 2 ** (index / self.per_octave)
+
+    def observe(self, seconds):
+        super().observe(seconds)
+        if seconds < self.min:
+            self.min = seconds
+        self.counts[min(self._index(seconds), len(self.counts) - 1)] += 1
+
+    def quantile(self, q):
+        """Estimated value below which ``q`` (0..1) of observations fall; 0 before any"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                # Narrow the bucket to the values actually seen before interpolating in it
+                lower = max(self.upper_bound(index - 1) if index else 0.0, self.min)
+                upper = min(self.upper_bound(index), self.max)
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return self.max
+
+    def percentiles(self):
+        return self.quantile(0.5), self.quantile(0.95), self.quantile(0.99)
+
+    def samples(self):
+        p50, p95, p99 = self.percentiles()
+        return super().samples() + [(f"{self.name}_p50", p50), (f"{self.name}_p95", p95), (f"{self.name}_p99", p99)]
+
+    def buckets(self, every=1):
+        """Cumulative ``(upper bound, count)`` pairs at every ``every``-th bucket, the last one +Inf"""
+        cumulative = 0
+        pairs = []
+        for index, count in enumerate(self.counts[:-1]):
+            cumulative += count
+            if index % every == every - 1:
+                pairs.append((self.upper_bound(index), cumulative))
+        pairs.append((math.inf, self.count))
+        return pairs
+
+# ─── Registry ─────────────────────────────────────────────────────────────────
+class MetricsRegistry:
+    """Named metrics for one session, created once and then bumped through the returned objects.
+
+    Callers resolve each metric when they set up (``counter``/``gauge``/
+    ``timer`` return the existing one for a name), so the hot path is a
+    plain attribute increment with no key lookups. ``labels`` identify the
+    session in exports, so files from many machines can be scraped side by
+    side.
+    """
+
+    def __init__(self, prefix='rs3core', labels=None):
+        self.prefix = prefix
+        self.labels = {'host': socket.gethostname(), 'pid': str(os.getpid())}
+        self.labels.update(labels or {})
+        self.metrics = {}
+
+    def _get(self, cls, name, help):
+        metric = self.metrics.get(name)
+        if metric is None:
+            metric = self.metrics[name] = cls(name, help)
+        elif type(metric) is not cls:
+            raise ValueError(f"Metric '{name}' is already a {metric.kind}")
+        return metric
+
+    def counter(self, name, help=''):
+        return self._get(Counter, name, help)
+
+    def gauge(self, name, help=''):
+        return self._get(Gauge, name, help)
+
+    def timer(self, name, help=''):
+        return self._get(Timer, name, help)
+
+    def histogram(self, name, help=''):
+        return self._get(Histogram, name, help)
+
+    def __getitem__(self, name):
+        return self.metrics[name].value
+
+    def __iter__(self):
+        return iter(self.metrics.values())
+
+    def snapshot(self):
+        """Every sample as a flat ``{name: value}`` dict"""
+        return {name: value for metric in self for name, value in metric.samples()}
+
+    # ─── Exports ──────────────────────────────────────────────────────────────
+    def to_prometheus(self):
+        """The Prometheus text exposition format, for a node_exporter textfile collector"""
+        labels = ','.join(f'{key}="{escape_label(value)}"' for key, value in sorted(self.labels.items()))
+        lines = []
+        for metric in self:
+            name = f"{self.prefix}_{metric.name}"
+            if metric.help:
+                lines.append(f"# HELP {name} {metric.help}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            if metric.kind == 'histogram':
+                # Four buckets per octave are plenty for dashboards and keep the file small
+                for bound, count in metric.buckets(max(1, metric.per_octave // 4)):
+                    le = '+Inf' if bound == math.inf else f"{bound:.6g}"
+                    lines.append(f"{name}_bucket{{{labels},le=\"{le}\"}} {count}")
+                lines.append(f"{name}_count{{{labels}}} {metric.count}")
+                lines.append(f"{name}_sum{{{labels}}} {metric.sum}")
+                continue
+            for sample, value in metric.samples():
+                if metric.kind == 'summary' and sample.endswith('_max'):
+                    # A summary may only carry _count/_sum, so the worst case is its own gauge
+                    lines.append(f"# TYPE {self.prefix}_{sample} gauge")
+                lines.append(f"{self.prefix}_{sample}{{{labels}}} {value}")
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path):
+        # Write then rename, so a scrape never reads a half-written file
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, 'w') as f:
+            f.write(self.to_prometheus())
+        os.replace(temporary, path)
+
+    def append_csv(self, path):
+        """Add one row (timestamp, labels, every sample) to ``path``, writing the header for a new file"""
+        labels = sorted(self.labels.items())
+        samples = self.snapshot()
+        new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+        with open(path, 'a', newline='') as f:
+            writer = csv.writer(f)
+            if new_file:
+                writer.writerow(['timestamp'] + [key for key, _ in labels] + list(samples))
+            writer.writerow([f"{time.time():.3f}"] + [value for _, value in labels] + list(samples.values()))
+
+    def export(self, path):
+        """Write to ``path`` in the format its extension names (.csv appends a row, anything else is Prometheus text)"""
+        if path.lower().endswith('.csv'):
+            self.append_csv(path)
+        else:
+            self.write_prometheus(path)
@@ -0,0 +1,247 @@
+import random
+import logging
+import math
+
+import numpy as np
+
+from .clock import SYSTEM_CLOCK
+from .timing import PlaybackTimer
+from .trajectory import TrajectoryBuilder
+
+logger = logging.getLogger(__name__)
+
+# ─── Anti-Bot Movement Settings ───────────────────────────────────────────────
+MOVEMENT_DEFAULTS = {
+    'curved_paths': True,        # Enable curved/arc movements instead of straight lines
+    'overshoot': True,           # Sometimes overshoot target and correct back
+    'hesitation': True,          # Add hesitation pauses during movement
+    'micro_corrections': True,   # Add small corrections after reaching target
+    'momentum': True,            # Simulate mouse momentum/inertia
+    'distraction_moves': True,   # Occasionally move to random spots first
+    'curve_intensity': 0.3,
+    'overshoot_chance': 0.15,
+    'hesitation_chance': 0.25,
+    'distraction_chance': 0.08,
+    'micro_correction_chance': 0.4,
+    'screen_bounds': None,       # Clamp for distraction moves; None = the game window (or the whole screen)
+}
+
+FALLBACK_SCREEN_BOUNDS = (200, 200, 3600, 2000)
+
+# ─── Curve Helpers ────────────────────────────────────────────────────────────
+def generate_curve_points(start_x, start_y, end_x, end_y, curve_intensity=0.3):
+    dx = end_x - start_x
+    dy = end_y - start_y
+    distance = math.hypot(dx, dy)
+
+    if distance < 10:
+        return None
+
+    perp_x = -dy / distance
+    perp_y = dx / distance
+
+    curve_offset = random.uniform(-distance * curve_intensity, distance * curve_intensity)
+
+    control1_x = start_x + dx * 0.25 + perp_x * curve_offset * 0.5
+    control1_y = start_y + dy * 0.25 + perp_y * curve_offset * 0.5
+    control2_x = start_x + dx * 0.75 + perp_x * curve_offset
+    control2_y = start_y + dy * 0.75 + perp_y * curve_offset
+
+    return {
+        'p0': (start_x, start_y),
+        'p1': (control1_x, control1_y),
+        'p2': (control2_x, control2_y),
+        'p3': (end_x, end_y)
+    }
+
+# ─── Target Selection ─────────────────────────────────────────────────────────
+def _safe_range(low, high, inset):
+    if low + inset >= high - inset:
+        return low, high
+    return low + inset, high - inset
+
+def random_target_within(region):
+    """Pick a click point inside region, mixing several distributions for coverage"""
+    x_min, y_min, x_max, y_max = (int(v) for v in region)
+    width = x_max - x_min
+    height = y_max - y_min
+
+    # For very small regions, use simple center-biased approach
+    if width <= 5 or height <= 5:
+        x = int((x_min + x_max) / 2 + random.uniform(-width/4, width/4))
+        y = int((y_min + y_max) / 2 + random.uniform(-height/4, height/4))
+        return max(x_min, min(x_max, x)), max(y_min, min(y_max, y))
+
+    strategy = random.choice(('uniform', 'gaussian_center', 'gaussian_edge', 'corners'))
+
+    if strategy == 'uniform':
+        inset = max(1, min(3, min(width, height) // 20))
+        x = random.randint(*_safe_range(x_min, x_max, inset))
+        y = random.randint(*_safe_range(y_min, y_max, inset))
+
+    elif strategy == 'gaussian_center':
+        x = int(random.gauss((x_min + x_max) / 2, max(1, width / 4)))
+        y = int(random.gauss((y_min + y_max) / 2, max(1, height / 4)))
+
+    elif strategy == 'gaussian_edge':
+        if random.random() < 0.5:
+            edge_x = x_min if random.random() < 0.5 else x_max
+            x = int(random.gauss(edge_x, max(1, width / 8)))
+            y = random.randint(*_safe_range(y_min, y_max, 2))
+        else:
+            edge_y = y_min if random.random() < 0.5 else y_max
+            y = int(random.gauss(edge_y, max(1, height / 8)))
+            x = random.randint(*_safe_range(x_min, x_max, 2))
+
+    else:  # corners
+        corner_bias = 0.3
+        if random.random() < 0.5:
+            x = int(x_min + width * corner_bias * random.random())
+        else:
+            x = int(x_max - width * corner_bias * random.random())
+        if random.random() < 0.5:
+            y = int(y_min + height * corner_bias * random.random())
+        else:
+            y = int(y_max - height * corner_bias * random.random())
+
+    return max(x_min, min(x_max, x)), max(y_min, min(y_max, y))
+
+# ─── Enhanced Human-like Movement System ───────────────────────────────────────
+class Mover:
+    """Human-like cursor movement shared by every routine, emitted through ``backend``.
+
+    Each path is built up front by ``TrajectoryBuilder`` and then played
+    back sample by sample. ``is_running`` is polled between samples so a
+    stop request aborts the current path; ``on_move`` is called once per
+    completed ``human_move``. ``bounds`` returns the (left, top, right,
+    bottom) distraction moves stay inside when ``screen_bounds`` is unset.
+    """
+
+    def __init__(self, backend, settings=None, is_running=None, on_move=None, rng=None, clock=None, bounds=None):
+        self.backend = backend
+        self.bounds = bounds or backend.screen_rect
+        self.clock = clock or SYSTEM_CLOCK
+        self.settings = dict(MOVEMENT_DEFAULTS)
+        if settings:
+            self.settings.update(settings)
+        self.is_running = is_running or (lambda: True)
+        self.on_move = on_move
+        self.trajectory = TrajectoryBuilder(self.settings, rng=rng)
+        self.timer = PlaybackTimer()
+
+    def play(self, path):
+        """Walk a precomputed (x, y, dt) path against absolute deadlines.
+
+        Stops early if the routine stops; completed paths are recorded on
+        ``self.timer`` so achieved-vs-target timing can be reported.
+        """
+        offsets = (np.cumsum(path[:, 2]) * 1e9).astype(np.int64).tolist()
+        start = self.clock.perf_counter_ns()
+        worst_late = 0
+        for (x, y), offset in zip(path[:, :2].tolist(), offsets):
+            if not self.is_running():
+                return
+            self.backend.move_to(x, y)
+            deadline = start + offset
+            worst_late = max(worst_late, self.clock.perf_counter_ns() - deadline)
+            self.clock.wait_until(deadline)
+        if offsets:
+            self.timer.record(len(offsets), offsets[-1], self.clock.perf_counter_ns() - start, worst_late)
+
+    def add_distraction_movement(self):
+        s = self.settings
+        if not s['distraction_moves'] or random.random() > s['distraction_chance']:
+            return
+
+        current_x, current_y = self.backend.position()
+        left, top, right, bottom = s['screen_bounds'] or self.bounds() or FALLBACK_SCREEN_BOUNDS
+        distraction_x = max(left, min(right, current_x + random.randint(-400, 400)))
+        distraction_y = max(top, min(bottom, current_y + random.randint(-200, 200)))
+
+        logger.debug("🎯 Distraction movement to (%d, %d)", distraction_x, distraction_y)
+        self.simple_move_to(distraction_x, distraction_y, speed_multiplier=1.5)
+        self.clock.sleep(random.uniform(0.1, 0.4))
+
+    def simple_move_to(self, to_x, to_y, speed_multiplier=1.0):
+        start_x, start_y = self.backend.position()
+        distance = math.hypot(to_x - start_x, to_y - start_y)
+        if distance < 2:
+            return
+
+        steps = int(max(5, min(15, distance / (4 * speed_multiplier))))
+        self.play(self.trajectory.simple(start_x, start_y, to_x, to_y, steps, speed_multiplier))
+
+    def human_move(self, to_x, to_y):
+        s = self.settings
+        start_x, start_y = self.backend.position()
+        if math.hypot(to_x - start_x, to_y - start_y) < 3:
+            return
+
+        self.add_distraction_movement()
+
+        start_x, start_y = self.backend.position()
+        distance = math.hypot(to_x - start_x, to_y - start_y)
+        logger.debug("🎯 Enhanced move from (%.0f, %.0f) to (%s, %s) - Distance: %.1fpx", start_x, start_y, to_x, to_y, distance)
+
+        use_curves = s['curved_paths'] and distance > 50 and random.random() < 0.7
+        will_overshoot = s['overshoot'] and distance > 30 and random.random() < s['overshoot_chance']
+
+        target_x, target_y = to_x, to_y
+        if will_overshoot:
+            overshoot_distance = random.uniform(5, 15)
+            angle = math.atan2(to_y - start_y, to_x - start_x)
+            target_x = to_x + overshoot_distance * math.cos(angle)
+            target_y = to_y + overshoot_distance * math.sin(angle)
+            logger.debug("🎯 Overshoot target: (%.0f, %.0f)", target_x, target_y)
+
+        steps = int(max(10, min(40, distance / 2)))
+
+        curve_points = None
+        if use_curves:
+            curve_points = generate_curve_points(start_x, start_y, target_x, target_y, s['curve_intensity'])
+        if curve_points:
+            self.move_along_curve(curve_points, steps)
+        else:
+            self.move_straight_enhanced(start_x, start_y, target_x, target_y, steps)
+
+        if will_overshoot and self.is_running():
+            self.clock.sleep(random.uniform(0.05, 0.15))
+            current_x, current_y = self.backend.position()
+            self.move_straight_enhanced(current_x, current_y, to_x, to_y, random.randint(3, 8))
+
+        if s['micro_corrections'] and random.random() < s['micro_correction_chance'] and self.is_running():
+            self.clock.sleep(random.uniform(0.02, 0.08))
+            self.backend.move_to(to_x + random.uniform(-1, 1), to_y + random.uniform(-1, 1))
+
+        if self.on_move:
+            self.on_move()
+
+        self.clock.sleep(random.uniform(0.08, 0.2))
+
+    def move_along_curve(self, curve_points, steps):
+        self.play(self.trajectory.curve(curve_points, steps))
+
+    def move_straight_enhanced(self, start_x, start_y, target_x, target_y, steps):
+        self.play(self.trajectory.straight(start_x, start_y, target_x, target_y, steps))
+
+    def click_region(self, region):
+        """Move into region, settle, and click. Returns the click point or None if stopped."""
+        if not self.move_into(region):
+            return None
+        return self.settle_and_click()
+
+    def move_into(self, region):
+        """Human-like move to a random point in ``region``; False if the routine stopped on the way"""
+        tx, ty = random_target_within(region)
+        self.human_move(tx, ty)
+        return self.is_running()
+
+    def settle_and_click(self):
+        current_x, current_y = self.backend.position()
+        self.backend.move_to(current_x + random.uniform(-0.8, 0.8),
+                             current_y + random.uniform(-0.8, 0.8))
+        self.clock.sleep(random.uniform(0.03, 0.12))
+
+        position = self.backend.position()
+        self.backend.click(*position)
+        return position
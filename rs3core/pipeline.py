@@ -0,0 +1,196 @@
+import logging
+import threading
+import time
+
+from .sensing import keep_frame
+
+logger = logging.getLogger(__name__)
+
+# ─── Frame Ring ───────────────────────────────────────────────────────────────
+class FrameRing:
+    """A fixed number of frame slots, reused round-robin between one writer and its readers.
+
+    Slots keep their arrays, so once every slot has seen a frame of a given
+    size nothing is allocated. The writer never touches a slot a reader has
+    checked out; when readers fall behind it overwrites the oldest unread
+    frame instead (latest wins, which is what detection wants).
+    """
+
+    def __init__(self, slots=4):
+        self.frames = [None] * slots
+        self.tags = [None] * slots
+        self.seqs = [-1] * slots
+        self.in_use = [0] * slots
+        self.latest = -1
+        self.next_slot = 0
+        self.lock = threading.Condition()
+
+    def write(self, frames, tag=None):
+        """Copy ``frames`` (a list of arrays) into the next free slot; False if none was free"""
+        with self.lock:
+            for _ in range(len(self.frames)):
+                slot = self.next_slot
+                self.next_slot = (self.next_slot + 1) % len(self.frames)
+                # Never reuse a checked-out slot or the one holding the newest frame
+                if not self.in_use[slot] and (self.seqs[slot] != self.latest or self.latest < 0):
+                    break
+            else:
+                return False
+            held = self.frames[slot]
+            if held is None or len(held) != len(frames):
+                held = [None] * len(frames)
+            self.in_use[slot] += 1
+        # Copy outside the lock; the slot is reserved, so readers skip it
+        frames = [keep_frame(frame, buffer) for frame, buffer in zip(frames, held)]
+        with self.lock:
+            self.frames[slot] = frames
+            self.tags[slot] = tag
+            self.in_use[slot] -= 1
+            self.latest += 1
+            self.seqs[slot] = self.latest
+            self.lock.notify_all()
+        return True
+
+    def read_newer(self, seq, timeout=None):
+        """Check out the newest frame set after ``seq``: ``(seq, slot, frames, tag)`` or None on timeout"""
+        with self.lock:
+            if not self.lock.wait_for(lambda: self.latest > seq, timeout):
+                return None
+            slot = self.seqs.index(self.latest)
+            self.in_use[slot] += 1
+            return self.latest, slot, self.frames[slot], self.tags[slot]
+
+    def release(self, slot):
+        with self.lock:
+            self.in_use[slot] -= 1
+
+# ─── Sensing Pipeline ─────────────────────────────────────────────────────────
+class _Watch:
+    def __init__(self, condition, regions, on_fire):
+        self.condition = condition
+        self.regions = regions
+        self.on_fire = on_fire
+        self.cancelled = threading.Event()
+        self.fired_at = None
+        # Held by the analysis thread for each test; cancelling waits on it
+        self.testing = threading.Lock()
+
+    def cancel(self):
+        """Stop the watch, returning only once no test of it is still running"""
+        self.cancelled.set()
+        with self.testing:
+            pass
+
+class SensingPipeline:
+    """Captures on one thread and tests conditions on another while the routine loop just waits.
+
+    ``watch`` hands over a condition that is already armed. The capture
+    thread grabs its regions every ``poll`` seconds into a ``FrameRing``;
+    the analysis thread takes the newest frame set, runs the condition and
+    calls ``on_fire`` the first time it holds. A slow test therefore never
+    holds up the next grab or the loop thread, which only waits on the
+    event ``on_fire`` sets. One condition is watched at a time. Conditions
+    are stateful and scripts share them between steps, and the loop thread
+    re-arms them, so ``cancel`` and ``watch`` return only once the analysis
+    thread has finished any test of the previous watch: after that the
+    condition is the caller's alone again.
+    """
+
+    def __init__(self, capture, slots=4, clock=time.monotonic):
+        self.capture = capture
+        self.ring = FrameRing(slots)
+        self.clock = clock
+        self.watching = None
+        self.changed = threading.Condition()
+        self.closed = False
+        self.threads = []
+        self.frames_captured = 0
+        self.frames_tested = 0
+
+    def _start(self):
+        if self.threads:
+            return
+        for target, name in ((self._capture_loop, 'sensing-capture'), (self._analysis_loop, 'sensing-analysis')):
+            thread = threading.Thread(target=target, name=name, daemon=True)
+            self.threads.append(thread)
+            thread.start()
+
+    def watch(self, condition, regions, on_fire):
+        self._start()
+        with self.changed:
+            previous, self.watching = self.watching, _Watch(condition, regions, on_fire)
+            if previous is not None:
+                previous.cancelled.set()
+            self.changed.notify_all()
+            watching = self.watching
+        if previous is not None:
+            previous.cancel()
+        return watching
+
+    def cancel(self):
+        with self.changed:
+            watch, self.watching = self.watching, None
+            if watch is not None:
+                watch.cancelled.set()
+        # Outside the lock: a test finishing may need it to fire (and will see the watch cancelled)
+        if watch is not None:
+            watch.cancel()
+
+    def _current(self):
+        with self.changed:
+            self.changed.wait_for(lambda: self.watching is not None or self.closed)
+            return self.watching
+
+    def _capture_loop(self):
+        while True:
+            watch = self._current()
+            if watch is None:
+                return
+            # Pace on the watch's own event so cancel/replace cuts the wait short
+            if watch.cancelled.wait(watch.condition.poll):
+                continue
+            try:
+                self.capture.prefetch(watch.regions)
+                frames = [self.capture.grab(region) for region in watch.regions]
+            except Exception as e:
+                logger.error(f"❌ Capture failed: {e}")
+                continue
+            if any(frame is None for frame in frames) or watch.cancelled.is_set():
+                continue
+            if self.ring.write(frames, (watch, self.clock())):
+                self.frames_captured += 1
+
+    def _analysis_loop(self):
+        seq = -1
+        while not self.closed:
+            checked_out = self.ring.read_newer(seq, timeout=0.5)
+            if checked_out is None:
+                continue
+            seq, slot, frames, (watch, taken) = checked_out
+            try:
+                with watch.testing:
+                    if watch.cancelled.is_set() or watch.fired_at is not None:
+                        continue
+                    self.frames_tested += 1
+                    if watch.condition.test_frames(iter(frames), taken):
+                        # Cancel and replace hold this lock too, so a watch dropped while its frame was being
+                        # tested can no longer wake whoever waits on the shared event next
+                        with self.changed:
+                            if watch.cancelled.is_set():
+                                continue
+                            watch.fired_at = taken
+                            watch.on_fire()
+            except Exception as e:
+                logger.error(f"❌ Condition check failed: {e}")
+            finally:
+                self.ring.release(slot)
+
+    def close(self):
+        with self.changed:
+            self.closed = True
+            watch, self.watching = self.watching, None
+            if watch is not None:
+                watch.cancelled.set()
+            self.changed.notify_all()
+        if watch is not None:
+            watch.cancel()
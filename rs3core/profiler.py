@@ -0,0 +1,107 @@
+import datetime
+import os
+import sys
+import threading
+import time
+
+DEFAULT_PROFILE_DIR = os.path.join(os.path.expanduser('~'), '.rs3core', 'profiles')
+SAMPLE_INTERVAL = 0.01  # 100 samples a second
+
+def profile_path(directory, routine):
+    slug = ''.join(c if c.isalnum() else '-' for c in routine.lower()).strip('-')
+    return os.path.join(directory, f"{slug}-{datetime.datetime.now():%Y%m%d-%H%M%S}.folded")
+
+# ─── Sampling Profiler ────────────────────────────────────────────────────────
+class SamplingProfiler:
+    """Samples one thread's Python stack on a timer and counts each distinct stack.
+
+    A background thread reads the target's current frame through
+    ``sys._current_frames``, so the profiled thread runs unmodified (no
+    trace or profile hooks); its only cost is the GIL being held for one
+    stack walk per sample, which ``overhead`` reports (high, if anything: it
+    includes the sampler's own wait for the GIL). ``write`` emits the
+    collapsed-stack format that flamegraph.pl, speedscope and inferno read.
+    """
+
+    def __init__(self, thread_id, interval=SAMPLE_INTERVAL):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = {}
+        self.labels = {}
+        self.samples = 0
+        self.sampling_sec = 0.0
+        self.elapsed = 0.0
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def start(self):
+        self.thread = threading.Thread(target=self._run, name='rs3core-profiler', daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join()
+        return self
+
+    @property
+    def overhead(self):
+        """Fraction of the profiled time the target spent stopped for sampling"""
+        return self.sampling_sec / self.elapsed if self.elapsed else 0.0
+
+    def sample(self):
+        """Count the target's current stack once; False once the thread has ended"""
+        frame = sys._current_frames().get(self.thread_id)
+        if frame is None:
+            return False
+        codes = []
+        while frame is not None:
+            codes.append(frame.f_code)
+            frame = frame.f_back
+        # Keyed by code objects; they are only turned into text when written
+        stack = tuple(codes)
+        self.stacks[stack] = self.stacks.get(stack, 0) + 1
+        self.samples += 1
+        return True
+
+    def _run(self):
+        started = time.perf_counter()
+        next_sample = started
+        while not self.stop_event.wait(max(0.0, next_sample - time.perf_counter())):
+            before = time.perf_counter()
+            if not self.sample():
+                break
+            self.sampling_sec += time.perf_counter() - before
+            # Skip ticks missed while the process was busy rather than firing them in a burst
+            next_sample = max(next_sample + self.interval, before)
+        self.elapsed = time.perf_counter() - started
+
+    # ─── Output ───────────────────────────────────────────────────────────────
+    def _label(self, code):
+        label = self.labels.get(code)
+        if label is None:
+            name = getattr(code, 'co_qualname', code.co_name)
+            label = self.labels[code] = f"{name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+        return label
+
+    def collapsed(self):
+        """``outermost;...;innermost count`` lines, the most sampled stack first"""
+        return [f"{';'.join(self._label(code) for code in reversed(stack))} {count}"
+                for stack, count in sorted(self.stacks.items(), key=lambda item: item[1], reverse=True)]
+
+    def hottest(self, count=3):
+        """``[(label, fraction of samples)]`` for the functions most often at the top of the stack"""
+        leaves = {}
+        for stack, samples in self.stacks.items():
+            leaves[stack[0]] = leaves.get(stack[0], 0) + samples
+        top = sorted(leaves.items(), key=lambda item: item[1], reverse=True)[:count]
+        return [(self._label(code), samples / self.samples) for code, samples in top]
+
+    def write(self, path):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(self.collapsed()) + '\n')
+        os.replace(temporary, path)
+        return path
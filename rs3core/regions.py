@@ -0,0 +1,189 @@
+import json
+import logging
+import os
+
+from .calibration_db import DEFAULT_PROFILE, CalibrationDB, resolution_key, routine_key
+
+logger = logging.getLogger(__name__)
+
+GAME_WINDOW_TITLE = 'RuneScape'
+REGION_FORMAT_VERSION = 2
+
+# ─── Region Transforms ────────────────────────────────────────────────────────
+# Regions are saved relative to the game window's client area, together
+# with the client size and DPI they were calibrated at. Moving the window
+# shifts them and resizing it (or a DPI change, which resizes it in
+# physical pixels) scales them, so neither needs a recalibration.
+
+def to_relative(regions, client, calibrated=None):
+    """Screen boxes -> boxes relative to the client area's top-left, scaled to the ``calibrated`` client's size"""
+    left, top, width, height = client
+    sx, sy = (calibrated[2] / width, calibrated[3] / height) if calibrated else (1.0, 1.0)
+    return {key: [(x1 - left) * sx, (y1 - top) * sy, (x2 - left) * sx, (y2 - top) * sy]
+            for key, (x1, y1, x2, y2) in regions.items()}
+
+def to_absolute(relative, calibrated, client):
+    """Boxes saved against the ``calibrated`` client rect -> screen boxes for the ``client`` rect now"""
+    left, top, width, height = client
+    sx, sy = width / calibrated[2], height / calibrated[3]
+    return {key: (round(left + x1 * sx), round(top + y1 * sy), round(left + x2 * sx), round(top + y2 * sy))
+            for key, (x1, y1, x2, y2) in relative.items()}
+
+def stored_regions(data):
+    """Screen boxes as calibrated, from either file format (v1 is a flat ``{key: box}`` dict)"""
+    if data is None or data.get('version') != REGION_FORMAT_VERSION:
+        return data
+    if data.get('client') is None:
+        return {key: tuple(box) for key, box in data['regions'].items()}
+    return to_absolute(data['regions'], data['client'], data['client'])
+
+# ─── Region Store ─────────────────────────────────────────────────────────────
+class RegionStore:
+    """One routine's regions in the calibration database, read and written relative to the game window.
+
+    ``current`` returns screen coordinates for wherever the window is now.
+    The transformed dict is cached against the client rect and DPI it was
+    built for, so as long as the window stays put a refresh costs one
+    window query and lookups are plain dict reads. When the window cannot
+    be found (another platform, or the client is minimised) regions are
+    used as saved. ``path`` is the routine's old region file: it names the
+    routine in the database and is imported on first load if the database
+    has nothing for it yet.
+    """
+
+    def __init__(self, path, backend, window_title=GAME_WINDOW_TITLE, db=None, profile=None):
+        self.path = path
+        self.backend = backend
+        self.window_title = window_title
+        self.db = db if db is not None else CalibrationDB()
+        self.routine = routine_key(path) if path else None
+        self.profile = profile or os.environ.get('RS3CORE_PROFILE', DEFAULT_PROFILE)
+        self.data = None
+        self.cached_for = None
+        self.cached = None
+
+    def client(self):
+        return self.backend.client_rect(self.window_title)
+
+    def resolution(self):
+        return resolution_key(self.backend.screen_rect())
+
+    def load(self, import_legacy=True):
+        """Read this routine's calibration; returns the regions for the current window, or None when there is none.
+
+        Without ``import_legacy`` nothing is written: an old region file is not read even if the database has nothing.
+        """
+        self.data = self.db.load_regions(self.routine, self.profile, self.resolution())
+        if self.data is None:
+            if not import_legacy:
+                return None
+            legacy = read_region_file(self.path)
+            if legacy is None:
+                return None
+            logger.info(f"📐 Importing {self.path} into {self.db.path}")
+            if legacy.get('version') == REGION_FORMAT_VERSION:
+                self.import_record(legacy)
+            else:
+                # v1 files hold screen boxes, so the window as it is now is the best reference there is
+                self.save(legacy)
+        self.cached_for = None
+        return self.current()
+
+    def import_record(self, data):
+        """Store a v2 file's boxes as saved, still relative to the client rect it was calibrated against"""
+        self.data = {
+            'resolution': resolution_key(data.get('screen')),
+            'client': data.get('client'),
+            'dpi': data.get('dpi'),
+            'screen': data.get('screen'),
+            'regions': {key: list(box) for key, box in data['regions'].items()},
+        }
+        self.db.save_regions(self.routine, self.profile, self.data)
+
+    def save(self, regions, keys=None):
+        """Store screen ``regions`` as seen with the window where it is now; just the ``keys`` ones when given"""
+        client = self.client()
+        resolution = self.resolution()
+        if keys is None or self.data is None or self.data['resolution'] != resolution:
+            self.data = {
+                'resolution': resolution,
+                'client': list(client) if client else None,
+                'dpi': self.backend.dpi(self.window_title),
+                'screen': self.backend.screen_rect(),
+                'regions': {},
+            }
+            keys = None
+        changed = {key: regions[key] for key in (regions if keys is None else keys)}
+        calibrated = self.data['client']
+        if calibrated:
+            # Window-relative record: with no window to measure against, the boxes are where ``current``
+            # put them, i.e. against the calibrated client rect, so convert through that rather than mix spaces
+            changed = to_relative(changed, client or calibrated, calibrated)
+        self.data['regions'].update({key: list(box) for key, box in changed.items()})
+        self.db.save_regions(self.routine, self.profile, self.data, keys)
+        self.cached_for = None
+        return self.current()
+
+    def current(self):
+        """Screen boxes for the window as it is now; rebuilt only when it has moved or resized"""
+        if self.data is None:
+            return None
+        calibrated = self.data['client']
+        client = self.client() if calibrated else None
+        key = (tuple(client) if client else None, self.backend.dpi(self.window_title) if client else None)
+        if self.cached is None or key != self.cached_for:
+            if client is None:
+                # No window to follow: as calibrated (or as given, when calibrated without one)
+                self.cached = to_absolute(self.data['regions'], calibrated or (0, 0, 1, 1), calibrated or (0, 0, 1, 1))
+            else:
+                self.cached = to_absolute(self.data['regions'], calibrated, client)
+                if self.cached_for is not None:
+                    logger.info(f"📐 Game window now at {client}; regions moved with it")
+            self.cached_for = key
+        return self.cached
+
+    def load_references(self):
+        """Reference snapshots for auto-locate, importing the old ``-references.npz`` file the first time"""
+        references = self.db.load_references(self.routine, self.profile)
+        if not references and self.path:
+            references = load_reference_file(self.path)
+            if references:
+                self.db.save_references(self.routine, self.profile, references)
+        return references
+
+    def save_references(self, references):
+        self.db.save_references(self.routine, self.profile, references)
+
+    def bounds(self):
+        """(left, top, right, bottom) to keep stray cursor moves in: the game window, else the desktop"""
+        client = self.client()
+        if client:
+            left, top, width, height = client
+            return left, top, left + width, top + height
+        return self.backend.screen_rect()
+
+# ─── Legacy Files ─────────────────────────────────────────────────────────────
+# One JSON file (and one -references.npz) per script in the working
+# directory, as calibrations were kept before the database.
+
+def read_region_file(region_file):
+    """A region file's JSON as saved, or None when there is no file"""
+    if region_file and os.path.exists(region_file):
+        with open(region_file, 'r') as f:
+            return json.load(f)
+    return None
+
+def load_region_file(region_file):
+    """A region file's boxes in screen coordinates, as calibrated"""
+    return stored_regions(read_region_file(region_file))
+
+def reference_file(region_file):
+    return f"{os.path.splitext(region_file)[0]}-references.npz"
+
+def load_reference_file(region_file):
+    path = reference_file(region_file)
+    if not os.path.exists(path):
+        return {}
+    import numpy as np
+    with np.load(path) as data:
+        return {key: data[key] for key in data.files}
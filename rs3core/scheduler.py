@@ -0,0 +1,74 @@
+import heapq
+import itertools
+import logging
+import random
+
+logger = logging.getLogger(__name__)
+
+# ─── Scheduler ────────────────────────────────────────────────────────────────
+class Scheduler:
+    """Min-heap of timed jobs with absolute due times, run on the caller's thread.
+
+    Nothing here spawns threads: the routine loop calls ``run_until`` whenever
+    it would otherwise sleep, so due jobs run between its own actions and
+    every key press or click goes out from that one thread. The wait between
+    jobs is a single sleep to the earliest due time (or the caller's
+    deadline, whichever is sooner).
+    """
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.jobs = []
+        self._order = itertools.count()
+
+    def call_at(self, when, callback, name='job'):
+        heapq.heappush(self.jobs, (when, next(self._order), name, callback))
+
+    def call_later(self, delay, callback, name='job'):
+        self.call_at(self.clock.time() + delay, callback, name)
+
+    def every(self, interval, callback, name='job', first=None):
+        """Run ``callback`` repeatedly; ``interval`` is seconds or a (min, max) range drawn per run.
+
+        The next run is measured from when the previous one finished. If the
+        callback returns a number, that delay is used once instead (e.g. a
+        retry back-off).
+        """
+        def draw():
+            return random.uniform(*interval) if isinstance(interval, (tuple, list)) else interval
+
+        def run():
+            retry = callback()
+            delay = retry if isinstance(retry, (int, float)) and not isinstance(retry, bool) else draw()
+            self.call_later(delay, run, name)
+
+        self.call_later(draw() if first is None else first, run, name)
+
+    def next_due(self):
+        return self.jobs[0][0] if self.jobs else None
+
+    def run_pending(self):
+        """Run every job whose due time has passed, earliest first"""
+        while self.jobs and self.jobs[0][0] <= self.clock.time():
+            _, _, name, callback = heapq.heappop(self.jobs)
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"❌ Scheduled job '{name}' failed: {e}")
+
+    def run_until(self, deadline, stop_event):
+        """Run due jobs until ``deadline``; returns True as soon as ``stop_event`` is set"""
+        while True:
+            self.run_pending()
+            if stop_event.is_set():
+                return True
+            now = self.clock.time()
+            if now >= deadline:
+                return False
+            due = self.next_due()
+            wake = deadline if due is None else min(deadline, due)
+            if self.clock.wait(stop_event, wake - now):
+                return True
+
+    def clear(self):
+        self.jobs.clear()
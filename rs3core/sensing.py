@@ -0,0 +1,273 @@
+# NumPy is imported on first use, so building conditions keeps it out of a script's import time
+_DCT_MATRICES = {}
+
+# ─── Frame Helpers ────────────────────────────────────────────────────────────
+def color_distance(frame, color):
+    """Per-pixel max channel difference from ``color`` (Chebyshev distance, 0-255)"""
+    import numpy as np
+    return np.abs(frame.astype(np.int16) - np.asarray(color, np.int16)).max(axis=-1)
+
+def color_fraction(frame, color, tolerance=20):
+    """Share of pixels within ``tolerance`` of ``color``"""
+    import numpy as np
+    return float(np.count_nonzero(color_distance(frame, color) <= tolerance)) / (frame.shape[0] * frame.shape[1])
+
+def keep_frame(frame, buffer=None):
+    """Copy a capture (a view the capture will overwrite) into ``buffer``, reusing it when the shape fits"""
+    import numpy as np
+    if buffer is None or buffer.shape != frame.shape:
+        return frame.copy()
+    np.copyto(buffer, frame)
+    return buffer
+
+def changed_fraction(frame, baseline, tolerance=24):
+    """Share of pixels that moved more than ``tolerance`` on any channel since ``baseline``"""
+    import numpy as np
+    if baseline is None or frame.shape != baseline.shape:
+        return 1.0
+    diff = np.abs(frame.astype(np.int16) - baseline.astype(np.int16)).max(axis=-1)
+    return float(np.count_nonzero(diff > tolerance)) / diff.size
+
+# ─── Perceptual Hash ──────────────────────────────────────────────────────────
+def shrink(frame, size):
+    """Grey ``size`` x ``size`` thumbnail by block averaging (regions smaller than ``size`` repeat pixels)"""
+    import numpy as np
+    gray = frame[..., :3].astype(np.float32).mean(axis=-1)
+    rows = np.linspace(0, gray.shape[0], size, endpoint=False).astype(int)
+    cols = np.linspace(0, gray.shape[1], size, endpoint=False).astype(int)
+    sums = np.add.reduceat(np.add.reduceat(gray, rows, axis=0), cols, axis=1)
+    counts = np.outer(np.diff(np.append(rows, gray.shape[0])), np.diff(np.append(cols, gray.shape[1])))
+    return sums / np.maximum(counts, 1)
+
+def dct_matrix(n):
+    """Orthonormal DCT-II basis, built once per size"""
+    import numpy as np
+    matrix = _DCT_MATRICES.get(n)
+    if matrix is None:
+        k = np.arange(n)[:, None]
+        matrix = np.cos(np.pi * (2 * np.arange(n)[None, :] + 1) * k / (2 * n)) * np.sqrt(2.0 / n)
+        matrix[0] /= np.sqrt(2.0)
+        matrix = _DCT_MATRICES[n] = matrix.astype(np.float32)
+    return matrix
+
+def phash(frame, hash_size=8, highfreq_factor=4):
+    """64-bit (for hash_size 8) perceptual hash: low DCT frequencies of a small thumbnail vs their median"""
+    import numpy as np
+    size = hash_size * highfreq_factor
+    dct = dct_matrix(size)
+    low = (dct @ shrink(frame, size) @ dct.T)[:hash_size, :hash_size]
+    bits = (low > np.median(low.ravel()[1:])).ravel()
+    return int.from_bytes(np.packbits(bits).tobytes(), 'big')
+
+def hamming(a, b):
+    return bin(a ^ b).count('1')
+
+# ─── Step Conditions ──────────────────────────────────────────────────────────
+class Condition:
+    """What a step's ``until`` waits for, tested on a capture of one region.
+
+    ``region`` is a calibrated region key or an explicit ``(x1, y1, x2, y2)``
+    box; None means the step's own region. After the step's action the
+    engine captures the region once and hands it to ``arm``, then re-captures
+    every ``poll`` seconds (a condition may change ``poll`` as it goes) and
+    stops waiting as soon as ``test`` is true. The step's ``duration`` still
+    applies as the timeout, so a condition that never fires costs nothing
+    compared with the plain timer.
+    """
+
+    def __init__(self, region=None, poll=0.2):
+        self.region = region
+        self.poll = poll
+
+    def arm(self, frame, now):
+        pass
+
+    def test(self, frame, now):
+        raise NotImplementedError
+
+    def describe(self):
+        return type(self).__name__
+
+    def leaves(self):
+        """The single-region conditions to capture for, in the order ``arm_frames``/``test_frames`` consume frames"""
+        return [self]
+
+    def arm_frames(self, frames, now):
+        self.arm(next(frames), now)
+
+    def test_frames(self, frames, now):
+        return self.test(next(frames), now)
+
+class AnyOf(Condition):
+    """True as soon as any of ``conditions`` is; their regions are all captured in the same tick"""
+
+    combine = staticmethod(any)
+
+    def __init__(self, *conditions):
+        super().__init__(None)
+        self.conditions = conditions
+
+    @property
+    def poll(self):
+        return min(condition.poll for condition in self.conditions)
+
+    @poll.setter
+    def poll(self, value):
+        pass
+
+    def leaves(self):
+        return [leaf for condition in self.conditions for leaf in condition.leaves()]
+
+    def arm_frames(self, frames, now):
+        for condition in self.conditions:
+            condition.arm_frames(frames, now)
+
+    def test_frames(self, frames, now):
+        # Test every part so each consumes its frame and keeps its own state current
+        return self.combine([condition.test_frames(frames, now) for condition in self.conditions])
+
+    def describe(self):
+        joiner = ' or ' if self.combine is any else ' and '
+        return joiner.join(condition.describe() for condition in self.conditions)
+
+class AllOf(AnyOf):
+    """True once all of ``conditions`` hold in the same tick"""
+
+    combine = staticmethod(all)
+
+class PixelColor(Condition):
+    """True once the pixel at ``point`` (offset inside the region) is within ``tolerance`` of ``color``"""
+
+    def __init__(self, region, point, color, tolerance=20, **kwargs):
+        super().__init__(region, **kwargs)
+        self.point = point
+        self.color = color
+        self.tolerance = tolerance
+
+    def test(self, frame, now):
+        x, y = self.point
+        return int(color_distance(frame[y:y + 1, x:x + 1], self.color)[0, 0]) <= self.tolerance
+
+    def describe(self):
+        return f"pixel {self.point} ~ {self.color}"
+
+class ColorFraction(Condition):
+    """True once the share of ``color`` pixels rises to ``above`` or drops to ``below``.
+
+    E.g. ``below=0.01`` waits for an item colour to leave the inventory,
+    ``above=0.2`` waits for an interface colour to fill a box.
+    """
+
+    def __init__(self, region, color, tolerance=20, above=None, below=None, **kwargs):
+        super().__init__(region, **kwargs)
+        self.color = color
+        self.tolerance = tolerance
+        self.above = above
+        self.below = below
+
+    def test(self, frame, now):
+        share = color_fraction(frame, self.color, self.tolerance)
+        if self.above is not None and share >= self.above:
+            return True
+        return self.below is not None and share <= self.below
+
+    def describe(self):
+        bound = f">= {self.above:.0%}" if self.above is not None else f"<= {self.below:.0%}"
+        return f"{self.color} {bound}"
+
+class RegionChanged(Condition):
+    """True once more than ``threshold`` of the region differs from how it looked right after the action"""
+
+    def __init__(self, region=None, threshold=0.1, tolerance=24, **kwargs):
+        super().__init__(region, **kwargs)
+        self.threshold = threshold
+        self.tolerance = tolerance
+        self.baseline = None
+
+    def arm(self, frame, now):
+        self.baseline = keep_frame(frame, self.baseline)
+
+    def test(self, frame, now):
+        return changed_fraction(frame, self.baseline, self.tolerance) > self.threshold
+
+    def describe(self):
+        return "region change"
+
+class RegionSettled(Condition):
+    """True once the region has changed and then held still for ``quiet`` seconds.
+
+    Fits anything that moves the camera or a counter and then stops: an
+    agility obstacle finishing, a teleport landing, an inventory that stops
+    emptying. Requiring a change first keeps it from firing before the
+    action has visibly started.
+    """
+
+    def __init__(self, region=None, quiet=1.2, threshold=0.02, tolerance=24, **kwargs):
+        super().__init__(region, **kwargs)
+        self.quiet = quiet
+        self.threshold = threshold
+        self.tolerance = tolerance
+        self.previous = None
+        self.moved = False
+        self.still_since = None
+
+    def arm(self, frame, now):
+        self.previous = keep_frame(frame, self.previous)
+        self.moved = False
+        self.still_since = None
+
+    def test(self, frame, now):
+        moving = changed_fraction(frame, self.previous, self.tolerance) > self.threshold
+        self.previous = keep_frame(frame, self.previous)
+        if moving:
+            self.moved = True
+            self.still_since = None
+            return False
+        if not self.moved:
+            return False
+        if self.still_since is None:
+            self.still_since = now
+        return now - self.still_since >= self.quiet
+
+    def describe(self):
+        return f"region settled {self.quiet:.1f}s"
+
+class HashChanged(Condition):
+    """True once the region's perceptual hash is ``threshold`` bits away from how it looked after the action.
+
+    For long idle waits: a harp going out of tune, a portable's progress
+    window closing. Only a 32x32 thumbnail is hashed, and the sampling rate
+    adapts: ``min_poll`` while the hash is moving, backing off towards
+    ``max_poll`` while it stays put. For ``grace`` seconds after arming the
+    baseline follows the screen, so the action's own animation is not taken
+    for the change.
+    """
+
+    def __init__(self, region=None, threshold=10, grace=0.0, min_poll=0.25, max_poll=2.0, hash_size=8):
+        super().__init__(region, poll=min_poll)
+        self.threshold = threshold
+        self.grace = grace
+        self.min_poll = min_poll
+        self.max_poll = max_poll
+        self.hash_size = hash_size
+        self.baseline = None
+        self.last = None
+        self.grace_until = 0.0
+
+    def arm(self, frame, now):
+        self.baseline = self.last = phash(frame, self.hash_size)
+        self.grace_until = now + self.grace
+        self.poll = self.min_poll
+
+    def test(self, frame, now):
+        current = phash(frame, self.hash_size)
+        moving = hamming(current, self.last) > 1
+        self.last = current
+        self.poll = self.min_poll if moving else min(self.poll * 1.5, self.max_poll)
+        if now < self.grace_until:
+            self.baseline = current
+            return False
+        return hamming(current, self.baseline) >= self.threshold
+
+    def describe(self):
+        return f"hash changed ({self.threshold}+ bits)"
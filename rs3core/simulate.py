@@ -0,0 +1,161 @@
+"""Run a routine against a simulated clock and a recording backend.
+
+    python -m rs3core.simulate general/Random/harmonic_dust.py --hours 24
+
+Waits, breaks and cursor paths all advance virtual time instantly, so a
+full-day session finishes in seconds and reports projected cycles/hour,
+break counts, input volume and memory growth. Memory growth is measured
+from the end of the first simulated hour, once the recorder's bounded event
+buffer has filled, so it reflects real leaks rather than warm-up.
+"""
+
+import argparse
+import logging
+import os
+import random
+import runpy
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from .backends import RecordingBackend
+from .calibration import region_steps
+from .capture import NullCapture
+from .clock import SimulatedClock
+from .engine import format_time, stat_key
+from .journal import Journal, analyze
+from .log import setup_logging
+
+logger = logging.getLogger(__name__)
+
+def _simulated_regions(routine):
+    """Calibrated regions where available, placeholder boxes for the rest.
+
+    Calibrations are only read: no old region file is imported, and no database is created where there is none.
+    """
+    store = routine.region_store
+    if routine.fixed_regions is not None:
+        regions = dict(routine.fixed_regions)
+    elif os.path.exists(store.db.path):
+        regions = dict(store.load(import_legacy=False) or {})
+    else:
+        regions = {}
+    for i, step in enumerate(region_steps(routine.calibration_steps())):
+        regions.setdefault(step['region_key'], (400 + 80 * i, 400, 460 + 80 * i, 460))
+    return regions
+
+def simulate(routine, hours=24.0, seed=None, journal=None):
+    """Run ``routine.loop()`` for ``hours`` of virtual time and return a summary dict
+
+    The session is journaled (in virtual time) to the file ``journal`` when
+    given, and not at all otherwise. The journal is then read back: virtual
+    time only passes in moves, actions and waits, which are all journaled,
+    so any stall the analyzer finds in it is a bug in the journal or the
+    analyzer, and is reported as one.
+    """
+    if seed is not None:
+        random.seed(seed)
+        routine.mover.trajectory.rng = np.random.default_rng(seed)
+
+    clock = SimulatedClock(start=time.time())
+    backend = RecordingBackend(capacity=1_000, clock=clock.perf_counter_ns)
+    routine.set_clock(clock)
+    routine.backend = routine.mover.backend = routine.region_store.backend = backend
+    routine.capture = NullCapture()  # conditions never fire, so every wait runs its full duration
+    routine.regions = _simulated_regions(routine)
+    routine.metrics = routine._new_metrics()
+    routine.journal = Journal(journal, routine.name, routine.steps) if journal else None
+
+    horizon = clock.time() + hours * 3600
+    clock.at(horizon, lambda: setattr(routine, 'running', False))
+
+    tracemalloc.start()
+    memory = [tracemalloc.get_traced_memory()[0]]
+    for hour in range(1, int(hours) + 1):
+        clock.at(clock.time() + hour * 3600, lambda: memory.append(tracemalloc.get_traced_memory()[0]))
+
+    wall_start = time.perf_counter()
+    routine.running = True
+    routine.session_start.set(clock.time())
+    routine.loop()
+    routine.running = False
+    if routine.journal is not None:
+        routine.journal.close()
+    wall = time.perf_counter() - wall_start
+
+    memory.append(tracemalloc.get_traced_memory()[0])
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    simulated = clock.time() - routine.session_start.value
+    stats = routine.metrics
+    report = {
+        'simulated_sec': simulated,
+        'wall_sec': wall,
+        'speedup': simulated / wall if wall > 0 else float('inf'),
+        'cycles': stats['total_cycles'],
+        'cycles_per_hour': stats['total_cycles'] / simulated * 3600 if simulated > 0 else 0,
+        'breaks': stats['total_breaks'],
+        'moves': stats['total_moves'],
+        'clicks': backend.count('click'),
+        'keys': backend.count('key'),
+        'memory_start': memory[1] if len(memory) > 2 else memory[0],
+        'memory_end': memory[-1],
+        'memory_peak': peak,
+        'memory_hourly': memory,
+        'stats': stats.snapshot(),
+    }
+    if journal:
+        (session,), _ = analyze([journal])
+        report['journal_stalls'] = session.stalls
+    return report
+
+def print_report(routine, report):
+    logger.warning("=" * 70)
+    logger.warning(f"{routine.emoji} {routine.name.upper()} SIMULATION")
+    logger.warning("=" * 70)
+    logger.warning(f"⏱️  Simulated {format_time(report['simulated_sec'])} in {report['wall_sec']:.2f}s ({report['speedup']:.0f}x)")
+    logger.warning(f"🔄 {routine.cycle_name}s: {report['cycles']} ({report['cycles_per_hour']:.1f}/hour)")
+    logger.warning(f"☕ Breaks: {report['breaks']}")
+    logger.warning(f"📍 Moves: {report['moves']}  🖱️ Clicks: {report['clicks']}  ⌨️  Keys: {report['keys']}")
+    for key in dict.fromkeys(stat_key(step) for step in list(routine.steps) + list(routine.periodic_keybinds)):
+        logger.warning(f"   • {key}: {report['stats'][key]}")
+    for line in routine.timing_report():
+        logger.warning(line)
+    growth = report['memory_end'] - report['memory_start']
+    logger.warning(f"🧠 Memory: {report['memory_start'] / 1024:.0f}KB -> {report['memory_end'] / 1024:.0f}KB "
+                   f"({growth / 1024:+.0f}KB, peak {report['memory_peak'] / 1024:.0f}KB)")
+    if 'journal_stalls' in report:
+        stalls = report['journal_stalls']
+        logger.warning(f"📓 Journal: {len(stalls)} stalls" + (", expected none" if stalls else ""))
+    logger.warning("=" * 70)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate a routine script at virtual speed")
+    parser.add_argument('script', help="routine script that defines a module-level `routine`")
+    parser.add_argument('--hours', type=float, default=24.0)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--verbose', action='store_true', help="show the routine's own INFO logging")
+    parser.add_argument('--journal', help="write the simulated session's journal to this file")
+    args = parser.parse_args(argv)
+
+    # Keep the script from opening a real input backend when it builds its Routine
+    os.environ['RS3CORE_BACKEND'] = 'recording'
+    os.environ['RS3CORE_CAPTURE'] = 'null'
+    setup_logging(logging.INFO if args.verbose else logging.WARNING)
+
+    namespace = runpy.run_path(args.script)
+    routine = namespace.get('routine')
+    if routine is None:
+        sys.exit(f"{args.script} does not define a module-level `routine`")
+
+    report = simulate(routine, hours=args.hours, seed=args.seed, journal=args.journal)
+    print_report(routine, report)
+    if report.get('journal_stalls'):
+        sys.exit(f"{len(report['journal_stalls'])} stalls in the journal of a simulated session")
+    return report
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""List routine scripts and measure how long they take to start.
+
+    python -m rs3core.startup                      # list every routine under the current directory
+    python -m rs3core.startup general/Random/harmonic_dust.py --runs 5
+
+Listing reads the scripts' source without importing them, so it takes
+milliseconds however many there are. Measuring imports a script in a
+fresh interpreter (its ``__main__`` block does not run) several times and
+reports the median cold start and the slowest imports; it fails with an
+error (and a non-zero exit) when the median is over ``--budget``.
+"""
+
+import argparse
+import ast
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from .engine import STARTUP_BUDGET_MS
+
+PROBE = """
+import runpy, sys, time
+start = time.perf_counter()
+namespace = runpy.run_path(sys.argv[1], run_name='__rs3core_probe__')
+if 'routine' not in namespace:
+    sys.exit('no module-level routine')
+print((time.perf_counter() - start) * 1000)
+"""
+
+# ─── Listing ──────────────────────────────────────────────────────────────────
+def routine_name(path):
+    """The ``name=`` given to ``Routine(...)`` in ``path``, or None if the script builds no routine"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            tree = ast.parse(f.read(), path)
+    except (OSError, SyntaxError, UnicodeDecodeError):
+        return None
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call) and getattr(node.func, 'id', None) == 'Routine':
+            for keyword in node.keywords:
+                if keyword.arg == 'name' and isinstance(keyword.value, ast.Constant):
+                    return keyword.value.value
+            return os.path.splitext(os.path.basename(path))[0]
+    return None
+
+def find_routines(root='.'):
+    """``[(name, path)]`` for every routine script under ``root``, by path"""
+    found = []
+    for directory, subdirectories, files in os.walk(root):
+        subdirectories[:] = sorted(d for d in subdirectories if not d.startswith(('.', '__')) and d != 'rs3core')
+        for file in sorted(files):
+            if file.endswith('.py'):
+                path = os.path.join(directory, file)
+                name = routine_name(path)
+                if name is not None:
+                    found.append((name, path))
+    return found
+
+# ─── Cold Start ───────────────────────────────────────────────────────────────
+def slowest_imports(importtime_output, count=5):
+    """``[(cumulative µs, module)]`` for the top-level imports that cost the most"""
+    imports = []
+    for line in importtime_output.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, module = line[len('import time:'):].split('|')
+        # Nested imports are indented under the one that pulled them in
+        if not module[1:].startswith(' '):
+            imports.append((int(cumulative), module.strip()))
+    return sorted(imports, reverse=True)[:count]
+
+def measure(script, runs=3):
+    """Median milliseconds to import ``script`` and build its routine, plus the slowest imports of the last run"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [os.getcwd(), os.environ.get('PYTHONPATH')])))
+    times = []
+    result = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, '-X', 'importtime', '-c', PROBE, script],
+                                capture_output=True, text=True, env=env)
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "probe failed")
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times), slowest_imports(result.stderr)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="List routine scripts or measure a script's cold start")
+    parser.add_argument('script', nargs='?', help="routine script to measure; lists routines when omitted")
+    parser.add_argument('--root', default='.', help="where to look for routine scripts")
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--budget', type=float, default=STARTUP_BUDGET_MS, help="milliseconds")
+    args = parser.parse_args(argv)
+
+    if args.script is None:
+        start = time.perf_counter()
+        routines = find_routines(args.root)
+        for name, path in routines:
+            print(f"{name:<40} {path}")
+        print(f"\n{len(routines)} routines found in {(time.perf_counter() - start) * 1000:.0f}ms")
+        return 0
+
+    median, slowest = measure(args.script, args.runs)
+    print(f"Cold start: {median:.0f}ms (median of {args.runs}, budget {args.budget:.0f}ms)")
+    for cumulative, module in slowest:
+        print(f"  {cumulative / 1000:7.1f}ms  {module}")
+    if median > args.budget:
+        sys.exit(f"FAILED: {args.script} starts in {median:.0f}ms, {median - args.budget:.0f}ms over the "
+                 f"{args.budget:.0f}ms budget")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+import ctypes
+import time
+from contextlib import contextmanager
+
+# Below this much remaining time the OS sleep is too coarse to trust, so the
+# last stretch before a deadline is spun on perf_counter_ns instead.
+SPIN_THRESHOLD_NS = 2_000_000
+
+# ─── Timer Resolution ─────────────────────────────────────────────────────────
+@contextmanager
+def high_resolution_timer(period_ms=1):
+    """Raise the Windows timer resolution for the duration of the block.
+
+    The default ~15.6 ms tick stretches every short sleep; winmm's
+    timeBeginPeriod brings it down to ``period_ms``. No-op elsewhere.
+    """
+    windll = getattr(ctypes, 'windll', None)
+    raised = bool(windll) and windll.winmm.timeBeginPeriod(period_ms) == 0
+    try:
+        yield raised
+    finally:
+        if raised:
+            windll.winmm.timeEndPeriod(period_ms)
+
+# ─── Deadline Playback ────────────────────────────────────────────────────────
+def wait_until(deadline_ns, spin_threshold_ns=SPIN_THRESHOLD_NS):
+    """Sleep most of the way to an absolute perf_counter_ns deadline, then spin"""
+    remaining = deadline_ns - time.perf_counter_ns()
+    if remaining > spin_threshold_ns:
+        time.sleep((remaining - spin_threshold_ns) / 1e9)
+    while time.perf_counter_ns() < deadline_ns:
+        pass
+
+class PlaybackTimer:
+    """Tracks how closely path playback hits its scheduled deadlines.
+
+    Deadlines are absolute offsets from the start of each path, so a late
+    sample shortens the next wait instead of pushing every later sample back.
+    """
+
+    def __init__(self):
+        self.paths = 0
+        self.samples = 0
+        self.target_ns = 0
+        self.achieved_ns = 0
+        self.worst_late_ns = 0
+
+    def record(self, samples, target_ns, achieved_ns, worst_late_ns):
+        self.paths += 1
+        self.samples += samples
+        self.target_ns += target_ns
+        self.achieved_ns += achieved_ns
+        self.worst_late_ns = max(self.worst_late_ns, worst_late_ns)
+
+    def summary(self):
+        if not self.paths:
+            return None
+        return {
+            'paths': self.paths,
+            'samples': self.samples,
+            'target_sec': self.target_ns / 1e9,
+            'achieved_sec': self.achieved_ns / 1e9,
+            'ratio': self.achieved_ns / self.target_ns if self.target_ns else 1.0,
+            'worst_late_ms': self.worst_late_ns / 1e6,
+        }
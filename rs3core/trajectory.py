@@ -0,0 +1,101 @@
+import numpy as np
+
+# Longest path any Mover builds (human_move caps at 40 samples); the buffer is
+# sized once so playback never allocates.
+MAX_SAMPLES = 64
+
+# ─── Vectorized Curve Helpers ─────────────────────────────────────────────────
+def ease_in_out_cubic(t):
+    return np.where(t < 0.5, 4 * t ** 3, 1 - (-2 * t + 2) ** 3 / 2)
+
+def ease_out_quad(t):
+    return 1 - (1 - t) * (1 - t)
+
+def bezier_curve(t, p0, p1, p2, p3):
+    u = 1 - t
+    return u ** 3 * p0 + 3 * u ** 2 * t * p1 + 3 * u * t ** 2 * p2 + t ** 3 * p3
+
+def curve_easing(t):
+    """Slow in over the first 30%, linear through the middle, slow out over the last 30%"""
+    eased = t.copy()
+    head = t < 0.3
+    tail = t > 0.7
+    eased[head] = ease_in_out_cubic(t[head] / 0.3) * 0.3
+    eased[tail] = 0.7 + ease_in_out_cubic((t[tail] - 0.7) / 0.3) * 0.3
+    return eased
+
+# ─── Trajectory Builder ───────────────────────────────────────────────────────
+class TrajectoryBuilder:
+    """Precomputes whole cursor paths as ``(x, y, dt)`` rows.
+
+    Each build fills the front of one preallocated buffer and returns a view
+    of it, so the next build overwrites the previous path. ``dt`` is the
+    pause after moving to ``(x, y)``, hesitation included.
+    """
+
+    def __init__(self, settings, rng=None, capacity=MAX_SAMPLES):
+        self.settings = settings
+        self.rng = rng or np.random.default_rng()
+        self.buffer = np.zeros((capacity, 3))
+
+    def _jitter(self, strength):
+        return self.rng.uniform(-1.0, 1.0, strength.shape) * strength
+
+    def _hesitation(self, t, low, high):
+        s = self.settings
+        if not s['hesitation']:
+            return 0.0
+        hesitate = self.rng.random(t.shape) < s['hesitation_chance'] * (1 - t)
+        return hesitate * self.rng.uniform(low, high, t.shape)
+
+    def _fill(self, x, y, dt):
+        steps = len(x)
+        if steps > len(self.buffer):
+            self.buffer = np.zeros((steps, 3))
+        path = self.buffer[:steps]
+        path[:, 0] = x
+        path[:, 1] = y
+        path[:, 2] = dt
+        return path
+
+    def curve(self, curve_points, steps):
+        """Bezier path through curve_points with jitter, hesitation and momentum"""
+        p0, p1, p2, p3 = curve_points['p0'], curve_points['p1'], curve_points['p2'], curve_points['p3']
+        t = np.arange(1, steps + 1) / steps
+        t_eased = curve_easing(t)
+
+        jitter_strength = (1 - t) * 0.8
+        x = bezier_curve(t_eased, p0[0], p1[0], p2[0], p3[0]) + self._jitter(jitter_strength)
+        y = bezier_curve(t_eased, p0[1], p1[1], p2[1], p3[1]) + self._jitter(jitter_strength)
+
+        dt = self.rng.uniform(0.008, 0.018, steps)
+        if self.settings['momentum']:
+            dt *= 1 - np.abs(t - 0.5) * 0.4
+        dt += self._hesitation(t, 0.02, 0.08)
+        return self._fill(x, y, dt)
+
+    def straight(self, start_x, start_y, target_x, target_y, steps):
+        """Eased straight path with jitter, a light tremor and hesitation"""
+        t = np.arange(1, steps + 1) / steps
+        t_eased = ease_in_out_cubic(t)
+
+        jitter_strength = (1 - t) * 0.7
+        tremor_x = np.sin(t * 20) * 0.1 * jitter_strength
+        tremor_y = np.cos(t * 25) * 0.1 * jitter_strength
+        x = start_x + (target_x - start_x) * t_eased + self._jitter(jitter_strength) + tremor_x
+        y = start_y + (target_y - start_y) * t_eased + self._jitter(jitter_strength) + tremor_y
+
+        dt = self.rng.uniform(0.006, 0.016, steps) + self._hesitation(t, 0.015, 0.06)
+        return self._fill(x, y, dt)
+
+    def simple(self, start_x, start_y, to_x, to_y, steps, speed_multiplier=1.0):
+        """Quick ease-out path used for distraction moves"""
+        t = np.arange(1, steps + 1) / steps
+        t_eased = ease_out_quad(t)
+
+        jitter_strength = (1 - t) * 0.3
+        x = start_x + (to_x - start_x) * t_eased + self._jitter(jitter_strength)
+        y = start_y + (to_y - start_y) * t_eased + self._jitter(jitter_strength)
+
+        dt = self.rng.uniform(0.005, 0.012, steps) / speed_multiplier
+        return self._fill(x, y, dt)
@@ -0,0 +1,222 @@
+import time
+import random
+import logging
+import threading
+import ctypes
+from ctypes import windll, wintypes
+
+logger = logging.getLogger(__name__)
+
+# ─── Native Windows Mouse Click and Keyboard Input ───────────────────────────
+PUL = ctypes.POINTER(ctypes.c_ulong)
+class KeyBdInput(ctypes.Structure):
+    _fields_ = [
+        ("wVk", ctypes.c_ushort),
+        ("wScan", ctypes.c_ushort),
+        ("dwFlags", ctypes.c_ulong),
+        ("time", ctypes.c_ulong),
+        ("dwExtraInfo", PUL)
+    ]
+
+class MouseInput(ctypes.Structure):
+    _fields_ = [
+        ("dx", ctypes.c_long),
+        ("dy", ctypes.c_long),
+        ("mouseData", ctypes.c_ulong),
+        ("dwFlags", ctypes.c_ulong),
+        ("time", ctypes.c_ulong),
+        ("dwExtraInfo", PUL)
+    ]
+
+class Input_I(ctypes.Union):
+    _fields_ = [("ki", KeyBdInput), ("mi", MouseInput)]
+
+class Input(ctypes.Structure):
+    _fields_ = [
+        ("type", ctypes.c_ulong),
+        ("ii", Input_I)
+    ]
+
+# Constants for input types and flags
+INPUT_MOUSE = 0
+INPUT_KEYBOARD = 1
+MOUSEEVENTF_MOVE       = 0x0001
+MOUSEEVENTF_LEFTDOWN   = 0x0002
+MOUSEEVENTF_LEFTUP     = 0x0004
+MOUSEEVENTF_VIRTUALDESK = 0x4000
+MOUSEEVENTF_ABSOLUTE   = 0x8000
+KEYEVENTF_KEYUP = 0x0002
+
+SM_XVIRTUALSCREEN  = 76
+SM_YVIRTUALSCREEN  = 77
+SM_CXVIRTUALSCREEN = 78
+SM_CYVIRTUALSCREEN = 79
+
+# Virtual key codes for the named keys; letters and digits map to their ASCII code
+VK_CODE = {
+    '-': 0xBD, '=': 0xBB, 'SPACE': 0x20, ' ': 0x20, 'ENTER': 0x0D,
+    'CTRL': 0x11, 'SHIFT': 0x10, 'ALT': 0x12, 'ESC': 0x1B, 'TAB': 0x09
+}
+
+def virtual_key(key):
+    """Resolve a key name ('SPACE', 'ctrl', '3', 'q') to its virtual key code"""
+    name = key if key == ' ' else key.upper()
+    if name in VK_CODE:
+        return VK_CODE[name]
+    if len(name) == 1 and name.isalnum():
+        return ord(name)
+    return None
+
+# ─── Batched Emission ─────────────────────────────────────────────────────────
+_EXTRA = ctypes.c_ulong(0)
+_EXTRA_PTR = ctypes.pointer(_EXTRA)
+
+class InputBatch:
+    """Queue INPUT events into one preallocated array and submit them in a single SendInput call.
+
+    The array and the shared dwExtraInfo pointer are created once, so
+    emitting a chord or a move-and-click allocates nothing per event.
+    """
+
+    def __init__(self, capacity=16):
+        self.events = (Input * capacity)()
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def _next(self, input_type):
+        if self.count == len(self.events):
+            self.flush()
+        event = self.events[self.count]
+        event.type = input_type
+        self.count += 1
+        return event
+
+    def key(self, vk_code, up=False):
+        ki = self._next(INPUT_KEYBOARD).ii.ki
+        ki.wVk = vk_code
+        ki.wScan = 0
+        ki.dwFlags = KEYEVENTF_KEYUP if up else 0
+        ki.time = 0
+        ki.dwExtraInfo = _EXTRA_PTR
+        return self
+
+    def mouse(self, flags, dx=0, dy=0):
+        mi = self._next(INPUT_MOUSE).ii.mi
+        mi.dx = dx
+        mi.dy = dy
+        mi.mouseData = 0
+        mi.dwFlags = flags
+        mi.time = 0
+        mi.dwExtraInfo = _EXTRA_PTR
+        return self
+
+    def move_to(self, x, y):
+        """Absolute move in virtual-desktop coordinates, normalised to SendInput's 0-65535 range"""
+        metrics = windll.user32.GetSystemMetrics
+        left, top = metrics(SM_XVIRTUALSCREEN), metrics(SM_YVIRTUALSCREEN)
+        width, height = metrics(SM_CXVIRTUALSCREEN), metrics(SM_CYVIRTUALSCREEN)
+        # Windows maps back with dx * width / 65536, truncating; aim at the pixel's first unit so it lands on it
+        dx = (int(x) - left) * 65536 // max(1, width) + 1
+        dy = (int(y) - top) * 65536 // max(1, height) + 1
+        return self.mouse(MOUSEEVENTF_MOVE | MOUSEEVENTF_ABSOLUTE | MOUSEEVENTF_VIRTUALDESK, dx, dy)
+
+    def flush(self):
+        """Submit every queued event in one syscall; returns how many were injected"""
+        count, self.count = self.count, 0
+        if not count:
+            return 0
+        return windll.user32.SendInput(count, self.events, ctypes.sizeof(Input))
+
+_batch = InputBatch()
+
+def send_native_click(x=None, y=None):
+    """Left click, optionally at (x, y)
+
+    The move and the press go out in one SendInput call and the release in
+    a second, after a short randomized hold like ``send_key_press`` keeps.
+    """
+    with _batch.lock:
+        if x is not None and y is not None:
+            _batch.move_to(x, y)
+        _batch.mouse(MOUSEEVENTF_LEFTDOWN)
+        _batch.flush()
+        time.sleep(random.uniform(0.01, 0.03))
+        _batch.mouse(MOUSEEVENTF_LEFTUP)
+        _batch.flush()
+
+def send_key_press(key):
+    """Send a key press using Windows SendInput API, including modifier combinations like 'CTRL+3'
+
+    Modifiers and the key go down together in one call and come back up in
+    reverse order in a second call, keeping a short randomized hold between.
+    """
+    parts = key.split('+') if len(key) > 1 else [key]
+    codes = [virtual_key(part) for part in parts]
+    if None in codes:
+        logger.warning(f"⚠️  Unknown key: {key}")
+        return False
+
+    with _batch.lock:
+        for vk_code in codes:
+            _batch.key(vk_code)
+        _batch.flush()
+        time.sleep(random.uniform(0.02, 0.05))
+        for vk_code in reversed(codes):
+            _batch.key(vk_code, up=True)
+        _batch.flush()
+
+    logger.debug("⌨️  Pressed key: %s", key)
+    return True
+
+def set_mouse_position(x, y):
+    windll.user32.SetCursorPos(int(x), int(y))
+
+# ─── Window Geometry ──────────────────────────────────────────────────────────
+DPI_AWARENESS_CONTEXT_PER_MONITOR_AWARE_V2 = -4
+PROCESS_PER_MONITOR_DPI_AWARE = 2
+DEFAULT_DPI = 96
+
+windll.user32.FindWindowW.restype = wintypes.HWND
+windll.user32.FindWindowW.argtypes = [wintypes.LPCWSTR, wintypes.LPCWSTR]
+
+def enable_dpi_awareness():
+    """Work in physical pixels on every monitor, so scaled displays don't shift clicks and captures"""
+    try:
+        if windll.user32.SetProcessDpiAwarenessContext(ctypes.c_void_p(DPI_AWARENESS_CONTEXT_PER_MONITOR_AWARE_V2)):
+            return True
+    except AttributeError:
+        pass
+    try:
+        return windll.shcore.SetProcessDpiAwareness(PROCESS_PER_MONITOR_DPI_AWARE) == 0
+    except (AttributeError, OSError):
+        return bool(windll.user32.SetProcessDPIAware())
+
+def find_window(title):
+    return windll.user32.FindWindowW(None, title) or None
+
+def get_client_rect(hwnd):
+    """Client area of ``hwnd`` as (left, top, width, height) in screen pixels, or None if it is gone/minimised"""
+    rect = wintypes.RECT()
+    origin = wintypes.POINT(0, 0)
+    if not windll.user32.GetClientRect(hwnd, ctypes.byref(rect)) or not windll.user32.ClientToScreen(hwnd, ctypes.byref(origin)):
+        return None
+    if rect.right <= 0 or rect.bottom <= 0:
+        return None
+    return origin.x, origin.y, rect.right, rect.bottom
+
+def get_window_dpi(hwnd):
+    try:
+        return windll.user32.GetDpiForWindow(hwnd) or DEFAULT_DPI
+    except AttributeError:
+        return DEFAULT_DPI
+
+def get_virtual_screen():
+    """Bounds of all monitors together as (left, top, right, bottom)"""
+    metrics = windll.user32.GetSystemMetrics
+    left, top = metrics(SM_XVIRTUALSCREEN), metrics(SM_YVIRTUALSCREEN)
+    return left, top, left + metrics(SM_CXVIRTUALSCREEN), top + metrics(SM_CYVIRTUALSCREEN)
+
+def get_current_mouse_position():
+    point = wintypes.POINT()
+    windll.user32.GetCursorPos(ctypes.byref(point))
+    return point.x, point.y